@@ -4,12 +4,13 @@ API routes for Business Card Processing API.
 Flask REST API endpoints for processing business cards.
 """
 
+import json
 import logging
 import os
 from typing import Optional
 from pathlib import Path
 
-from flask import Blueprint, request, jsonify, send_file, current_app
+from flask import Blueprint, Response, request, jsonify, send_file, current_app, stream_with_context
 from werkzeug.utils import secure_filename
 
 from src.pipeline import CardResearchPipeline
@@ -38,12 +39,22 @@ def get_pipeline() -> CardResearchPipeline:
             output_folder=Config.OUTPUT_FOLDER,
             ocr_languages=Config.OCR_LANGUAGES,
             ocr_gpu=Config.OCR_GPU,
+            ocr_pool_workers=Config.OCR_POOL_WORKERS,
+            ocr_cache_path=Config.OCR_CACHE_PATH,
+            ocr_compile_models=Config.OCR_TORCH_COMPILE,
+            ocr_precision=Config.OCR_PRECISION,
+            ocr_fast_path_min_lines=Config.OCR_FAST_PATH_MIN_LINES,
+            ocr_fast_path_min_confidence=Config.OCR_FAST_PATH_MIN_CONFIDENCE,
+            ocr_batch_size=Config.OCR_BATCH_SIZE,
+            batch_workers=Config.PARALLEL_WORKERS if Config.PARALLEL_PROCESSING else 1,
+            ocr_concurrency=Config.OCR_CONCURRENCY,
             hunter_api_key=Config.HUNTER_API_KEY,
             abstract_api_key=Config.ABSTRACT_API_KEY,
             github_token=Config.GITHUB_TOKEN,
             gemini_api_key=Config.GOOGLE_API_KEY,
             use_gemini_fallback=Config.USE_GEMINI_FALLBACK,
-            gemini_model=Config.GEMINI_MODEL
+            gemini_model=Config.GEMINI_MODEL,
+            gemini_max_concurrency=Config.GEMINI_MAX_CONCURRENCY
         )
         logger.info("Pipeline initialized with Gemini fallback: " + str(Config.USE_GEMINI_FALLBACK and Config.GOOGLE_API_KEY is not None))
     
@@ -183,6 +194,7 @@ def process_batch():
     
     Processes files in chunks and returns results progressively.
     For large batches (>10 files), automatically uses progressive processing.
+    With ?stream=true, results are streamed as NDJSON as each card finishes.
     """
     if "files" not in request.files:
         return jsonify({
@@ -193,6 +205,7 @@ def process_batch():
     files = request.files.getlist("files")
     enrich = request.args.get("enrich", "false").lower() == "true"  # Default to false for speed
     force_gemini = request.args.get("force_gemini", "false").lower() == "true"
+    stream = request.args.get("stream", "false").lower() == "true"
 
     try:
         saved_paths = []
@@ -212,21 +225,29 @@ def process_batch():
 
         pipeline = get_pipeline()
         
-        # For small batches, process normally
-        if len(saved_paths) <= 10:
-            results = []
-            for i, image_path in enumerate(saved_paths):
+        # Streaming: one JSON result per line as each card finishes
+        if stream:
+            def generate():
                 try:
-                    result = pipeline.process_image(image_path, enrich=enrich, force_gemini=force_gemini)
-                    results.append(result)
-                    logger.info(f"Processed {i+1}/{len(saved_paths)}: {image_path.name}")
-                except Exception as e:
-                    logger.error(f"Error processing {image_path}: {e}")
-                    results.append({
-                        "success": False,
-                        "error": str(e),
-                        "image": str(image_path)
-                    })
+                    for result in pipeline.process_batch_iter(
+                        saved_paths, enrich=enrich, force_gemini=force_gemini
+                    ):
+                        yield json.dumps(result, default=str) + "\n"
+                finally:
+                    for p in saved_paths:
+                        try:
+                            os.remove(p)
+                        except Exception:
+                            pass
+            
+            return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+        
+        # For small batches, process normally (in parallel when
+        # CARD_API_PARALLEL_PROCESSING is on)
+        if len(saved_paths) <= 10:
+            batch = pipeline.process_batch(saved_paths, enrich=enrich, force_gemini=force_gemini)
+            results = batch.get("results", [])
+            logger.info(f"Processed {len(results)}/{len(saved_paths)} images")
             
             # Clean up files
             for p in saved_paths:
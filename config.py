@@ -49,9 +49,25 @@ class Config:
     OCR_MAG_RATIO: float = float(os.getenv("CARD_API_OCR_MAG_RATIO", "1.5"))
     OCR_MIN_SIZE: int = int(os.getenv("CARD_API_OCR_MIN_SIZE", "5"))
     OCR_GPU: bool = os.getenv("CARD_API_OCR_GPU", "True").lower() == "true"
+    # Warm EasyOCR worker processes (0 = run OCR in the API process)
+    OCR_POOL_WORKERS: int = int(os.getenv("CARD_API_OCR_POOL_WORKERS", "0"))
+    # SQLite file for caching OCR results by image hash (empty = disabled)
+    OCR_CACHE_PATH: Optional[str] = os.getenv("CARD_API_OCR_CACHE_PATH") or None
+    # torch.compile the EasyOCR models (GPU only)
+    OCR_TORCH_COMPILE: bool = os.getenv("CARD_API_OCR_TORCH_COMPILE", "False").lower() == "true"
+    # EasyOCR model precision: fp32 or fp16 (fp16 applies on GPU only)
+    OCR_PRECISION: str = os.getenv("CARD_API_OCR_PRECISION", "fp32").lower()
+    # Try OCR on the unenhanced image first; enhance only if it yields fewer
+    # lines or lower confidence than this (0 lines = always enhance)
+    OCR_FAST_PATH_MIN_LINES: int = int(os.getenv("CARD_API_OCR_FAST_PATH_MIN_LINES", "0"))
+    OCR_FAST_PATH_MIN_CONFIDENCE: float = float(os.getenv("CARD_API_OCR_FAST_PATH_MIN_CONFIDENCE", "0.6"))
+    # Most same-size images per readtext_batched call in GPU batches
+    OCR_BATCH_SIZE: int = int(os.getenv("CARD_API_OCR_BATCH_SIZE", "16"))
     # Batch processing
     PARALLEL_PROCESSING: bool = os.getenv("CARD_API_PARALLEL_PROCESSING", "False").lower() == "true"
     PARALLEL_WORKERS: int = int(os.getenv("CARD_API_PARALLEL_WORKERS", "2"))
+    # Cap on images in EasyOCR at once while other workers parse and enrich (0 = no cap)
+    OCR_CONCURRENCY: int = int(os.getenv("CARD_API_OCR_CONCURRENCY", "0"))
     
     # Free API Keys (Optional - for enrichment)
     HUNTER_API_KEY: Optional[str] = os.getenv("HUNTER_API_KEY")
@@ -63,6 +79,8 @@ class Config:
     GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")  
     USE_GEMINI_FALLBACK: bool = os.getenv("USE_GEMINI_FALLBACK", "True").lower() == "true"
     GEMINI_FALLBACK_THRESHOLD: float = float(os.getenv("GEMINI_FALLBACK_THRESHOLD", "0.6"))
+    # Gemini requests in flight at once (rate-limited ones retry with backoff)
+    GEMINI_MAX_CONCURRENCY: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", "2"))
     
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = int(os.getenv("CARD_API_RATE_LIMIT", "60"))
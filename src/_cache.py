@@ -0,0 +1,116 @@
+"""
+SQLite-backed cache for EasyOCR results.
+
+Results are keyed by a BLAKE2b digest of the raw image bytes plus the OCR
+parameters, so resubmitting the same card skips inference entirely.
+Results are stored as JSON (never pickle), so a tampered cache file can
+at worst produce wrong text, not run code.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert NumPy scalars/arrays in EasyOCR results for json.dumps."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Cannot store {type(value).__name__} in the OCR cache")
+
+
+class OCRResultCache:
+    """Persistent OCR result cache with one SQLite connection per thread."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_cache (key BLOB PRIMARY KEY, results BLOB)"
+        )
+        conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def make_key(image_bytes: bytes, params: Dict[str, Any]) -> bytes:
+        """
+        Build a cache key from image content and OCR parameters.
+
+        Args:
+            image_bytes: Raw image file bytes
+            params: OCR parameters that affect the result
+
+        Returns:
+            BLAKE2b digest
+        """
+        h = hashlib.blake2b(image_bytes)
+        h.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+        return h.digest()
+
+    def get(self, key: bytes) -> Optional[List]:
+        """
+        Look up cached OCR results.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached results or None on miss
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT results FROM ocr_cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"OCR cache lookup failed: {e}")
+            return None
+
+        if not row:
+            return None
+        try:
+            # Each result is a (bbox, text, confidence) tuple
+            return [tuple(item) for item in json.loads(row[0])]
+        except (ValueError, TypeError) as e:
+            # Unreadable rows (e.g. written by an older version) are misses
+            logger.warning(f"Ignoring unreadable OCR cache entry: {e}")
+            return None
+
+    def set(self, key: bytes, results: List) -> None:
+        """
+        Store OCR results.
+
+        Args:
+            key: Cache key from make_key
+            results: EasyOCR results to store
+        """
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO ocr_cache (key, results) VALUES (?, ?)",
+                (key, json.dumps(results, default=_to_builtin))
+            )
+            conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"OCR cache store failed: {e}")
@@ -0,0 +1,130 @@
+"""
+Multi-keyword substring matching for the parser heuristics.
+
+A KeywordMatcher answers "does any of these keywords occur in this text?"
+in a single pass over the text instead of one `in` scan per keyword. It
+uses a pyahocorasick automaton when the package is installed and a
+compiled regex alternation otherwise. A KeywordCategories does the same
+for several named keyword lists at once, reporting which lists hit.
+"""
+import logging
+import re
+from typing import Dict, FrozenSet, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordMatcher:
+    """Finds keyword substrings in text with one scan."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the matcher.
+
+        Args:
+            keywords: Keywords to look for, in priority order
+        """
+        # Keep the first occurrence of each keyword; its index is its priority
+        self.keywords = list(dict.fromkeys(keywords))
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for priority, keyword in enumerate(self.keywords):
+                self._automaton.add_word(keyword, priority)
+            self._automaton.make_automaton()
+            self._regex = None
+        else:
+            self._automaton = None
+            # Longest first so the alternation never stops on a shorter prefix
+            alternation = "|".join(
+                re.escape(k) for k in sorted(self.keywords, key=len, reverse=True)
+            )
+            self._regex = re.compile(alternation)
+
+    def search(self, text: str) -> bool:
+        """
+        Check whether any keyword occurs in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            True if at least one keyword is a substring of text
+        """
+        if self._automaton is not None:
+            for _ in self._automaton.iter(text):
+                return True
+            return False
+        return self._regex.search(text) is not None
+
+    def first(self, text: str) -> Optional[str]:
+        """
+        Get the highest-priority keyword that occurs in the text.
+
+        Equivalent to `next((k for k in keywords if k in text), None)`.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matching keyword earliest in the keyword list, or None
+        """
+        if self._automaton is not None:
+            best = min((p for _, p in self._automaton.iter(text)), default=None)
+            return None if best is None else self.keywords[best]
+
+        if self._regex.search(text) is None:
+            return None
+        return next(k for k in self.keywords if k in text)
+
+
+class KeywordCategories:
+    """Finds which of several keyword lists occur in text with one scan."""
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        """
+        Build the matcher.
+
+        Args:
+            categories: Keyword lists keyed by category name
+        """
+        if AHOCORASICK_AVAILABLE:
+            # A keyword in several lists reports all of their categories
+            owners: Dict[str, set] = {}
+            for name, keywords in categories.items():
+                for keyword in keywords:
+                    owners.setdefault(keyword, set()).add(name)
+            self._automaton = ahocorasick.Automaton()
+            for keyword, names in owners.items():
+                self._automaton.add_word(keyword, frozenset(names))
+            self._automaton.make_automaton()
+            self._matchers = None
+        else:
+            # Overlapping hits across categories rule out one shared regex
+            self._automaton = None
+            self._matchers = {
+                name: KeywordMatcher(keywords) for name, keywords in categories.items()
+            }
+
+    def search(self, text: str) -> FrozenSet[str]:
+        """
+        Get the categories with at least one keyword in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Names of the matching categories
+        """
+        if self._automaton is not None:
+            return frozenset().union(*(names for _, names in self._automaton.iter(text)))
+        return frozenset(
+            name for name, matcher in self._matchers.items() if matcher.search(text)
+        )
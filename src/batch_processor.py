@@ -93,13 +93,12 @@ class ProgressiveBatchProcessor:
         
         job['status'] = f"processing_batch_{job['current_batch'] + 1}"
         
-        for image_path in batch_images:
-            try:
-                result = pipeline.process_image(image_path, enrich=False)  # Skip enrichment for speed
-                batch_results.append({
-                    'image': str(image_path),
-                    'result': result
-                })
+        # Update the job as each card finishes (the pipeline may run the
+        # batch in parallel, so results arrive in completion order)
+        results = {}
+        try:
+            for result in pipeline.process_batch_iter(batch_images, enrich=False):  # Skip enrichment for speed
+                results[result.get('image')] = result
                 
                 if result.get('success'):
                     job['successful'] += 1
@@ -109,17 +108,24 @@ class ProgressiveBatchProcessor:
                 job['processed'] += 1
                 job['last_update'] = time.time()
                 
-            except Exception as e:
-                logger.error(f"Error processing {image_path}: {e}")
-                batch_results.append({
-                    'image': str(image_path),
-                    'result': {
-                        'success': False,
-                        'error': str(e)
-                    }
-                })
+        except Exception as e:
+            logger.error(f"Error processing batch {job['current_batch'] + 1}: {e}")
+            error = str(e)
+        else:
+            error = 'No result returned'
+        
+        for image_path in batch_images:
+            result = results.get(str(image_path))
+            if result is None:
+                # Only cards the batch never reported count as failed here
+                result = {'success': False, 'error': error}
                 job['failed'] += 1
                 job['processed'] += 1
+                job['last_update'] = time.time()
+            batch_results.append({
+                'image': str(image_path),
+                'result': result
+            })
         
         # Add batch results to job
         job['results'].extend(batch_results)
@@ -11,14 +11,21 @@ Free APIs used:
 """
 
 import logging
+import operator
 import re
 import requests
 from typing import Dict, Optional, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from urllib.parse import urlparse
 
+from ._keywords import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
+# str.translate table that deletes ASCII digits (one C-level pass per string)
+_DELETE_DIGITS = str.maketrans("", "", "0123456789")
+
 
 @dataclass
 class CompanyEnrichment:
@@ -126,6 +133,9 @@ class CompanyEnricher:
     # Request timeout
     TIMEOUT = 5
     
+    # Characters dropped when building a LinkedIn company slug
+    SLUG_STRIP_PATTERN = re.compile(r'[^a-zA-Z0-9\s]')
+    
     # Known company domains for common email providers (skip these)
     PERSONAL_EMAIL_DOMAINS = {
         "gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "aol.com",
@@ -151,13 +161,20 @@ class CompanyEnricher:
         "marketing": ["marketing", "advertising", "media", "creative", "agency"],
     }
     
-    def __init__(self, skip_logo_check: bool = True):
+    # Distinct (company, domain) enrichments kept in memory
+    ENRICH_CACHE_SIZE = 512
+    
+    def __init__(self, skip_logo_check: bool = True, session: Optional[requests.Session] = None):
         """Initialize the company enricher.
         
         Args:
             skip_logo_check: Skip HTTP call to check logo (faster). Default True for speed.
+            session: HTTP session for the logo check (a plain one if omitted)
         """
         self.skip_logo_check = skip_logo_check
+        self.session = session or requests.Session()
+        # Cards from one company share a result (and its logo check)
+        self._enrich_cached = lru_cache(maxsize=self.ENRICH_CACHE_SIZE)(self._enrich_domain)
         # Only log on first init, not every request
     
     def enrich(
@@ -179,12 +196,28 @@ class CompanyEnricher:
         Returns:
             CompanyEnrichment with discovered data
         """
-        enrichment = CompanyEnrichment()
-        enrichment.name = company_name
-        
         # Extract domain from email or website
         domain = self._extract_domain(email, website)
         
+        # The result depends only on the name and domain; copy the lists so
+        # callers cannot change the cached entry
+        cached = self._enrich_cached(company_name, domain, fetch_logo)
+        return replace(
+            cached,
+            enrichment_sources=list(cached.enrichment_sources),
+            enrichment_errors=list(cached.enrichment_errors)
+        )
+    
+    def _enrich_domain(
+        self,
+        company_name: Optional[str],
+        domain: Optional[str],
+        fetch_logo: bool
+    ) -> CompanyEnrichment:
+        """Enrich a company from its name and already-extracted domain."""
+        enrichment = CompanyEnrichment()
+        enrichment.name = company_name
+        
         if domain:
             enrichment.domain = domain
             
@@ -251,7 +284,7 @@ class CompanyEnricher:
         
         try:
             # Just check if the logo exists (HEAD request)
-            response = requests.head(logo_url, timeout=self.TIMEOUT, allow_redirects=True)
+            response = self.session.head(logo_url, timeout=self.TIMEOUT, allow_redirects=True)
             
             if response.status_code == 200:
                 logger.debug(f"Found logo for {domain}")
@@ -285,7 +318,7 @@ class CompanyEnricher:
             return None
         
         # Clean company name for URL
-        clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', company_name)
+        clean_name = self.SLUG_STRIP_PATTERN.sub('', company_name)
         clean_name = clean_name.strip().replace(' ', '-').lower()
         
         if clean_name:
@@ -310,15 +343,54 @@ class FieldConfidenceScorer:
     PHONE_PATTERN = re.compile(r'^[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}$')
     URL_PATTERN = re.compile(r'^(?:https?://)?(?:www\.)?[a-zA-Z0-9-]+\.[a-zA-Z]{2,}')
     
+    # Country code prefix ("+" or "1") after any leading separators
+    PHONE_COUNTRY_CODE_PATTERN = re.compile(r'[\s\.\-\(\)]*[+1]')
+    
+    # Address patterns
+    ZIP_PATTERN = re.compile(r'\b\d{5}(?:-\d{4})?\b')
+    STATE_PATTERN = re.compile(r'\b[A-Z]{2}\b')
+    ADDRESS_INDICATORS = KeywordMatcher([
+        "street", "st", "avenue", "ave", "road", "rd", "drive", "dr",
+        "suite", "floor", "building", "blvd", "lane", "ln", "way"
+    ])
+    
     # Common name patterns
     NAME_PATTERN = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$')
     
-    # Suspicious patterns (OCR errors)
-    OCR_ERROR_PATTERNS = [
-        re.compile(r'[0-9]'),  # Numbers in names
-        re.compile(r'[|!1l]{2,}'),  # Multiple similar chars (OCR confusion)
-        re.compile(r'\s{3,}'),  # Multiple spaces
-    ]
+    # Suspicious patterns (OCR errors), as one alternation
+    OCR_ERROR_PATTERN = re.compile(
+        r'[0-9]'  # Numbers in names
+        r'|[|!1l]{2,}'  # Multiple similar chars (OCR confusion)
+        r'|\s{3,}'  # Multiple spaces
+    )
+    
+    # Common company indicators
+    COMPANY_INDICATORS = KeywordMatcher([
+        "inc", "llc", "ltd", "corp", "co", "company", "group", "international"
+    ])
+    
+    # Common title keywords
+    TITLE_KEYWORDS = KeywordMatcher([
+        "manager", "director", "president", "ceo", "cto", "cfo", "vp",
+        "engineer", "developer", "designer", "analyst", "consultant",
+        "agent", "specialist", "coordinator", "lead", "senior", "founder",
+        "owner", "partner", "associate", "executive", "officer"
+    ])
+    
+    # Weight of each field in the overall confidence (weighted average)
+    FIELD_WEIGHTS = (
+        ("name", 0.25),
+        ("email", 0.25),
+        ("phone", 0.15),
+        ("company", 0.15),
+        ("title", 0.10),
+        ("website", 0.05),
+        ("address", 0.03),
+        ("linkedin", 0.02),
+    )
+    # The weighted fields' scores read in one call, and their weights
+    _weighted_scores = operator.attrgetter(*(f for f, _ in FIELD_WEIGHTS))
+    _WEIGHTS = tuple(w for _, w in FIELD_WEIGHTS)
     
     def __init__(self, base_ocr_confidence: float = 1.0):
         """
@@ -361,22 +433,10 @@ class FieldConfidenceScorer:
         confidence.linkedin = self._score_linkedin(contact_data.get("linkedin"))
         
         # Calculate overall confidence (weighted average)
-        weights = {
-            "name": 0.25,
-            "email": 0.25,
-            "phone": 0.15,
-            "company": 0.15,
-            "title": 0.10,
-            "website": 0.05,
-            "address": 0.03,
-            "linkedin": 0.02
-        }
-        
         total_weight = 0
         weighted_sum = 0
         
-        for field, weight in weights.items():
-            value = getattr(confidence, field, 0)
+        for value, weight in zip(self._weighted_scores(confidence), self._WEIGHTS):
             if value > 0:
                 weighted_sum += value * weight
                 total_weight += weight
@@ -405,7 +465,7 @@ class FieldConfidenceScorer:
             score += 0.1
         
         # Check for OCR errors (numbers in name)
-        if any(pattern.search(name) for pattern in self.OCR_ERROR_PATTERNS):
+        if self.OCR_ERROR_PATTERN.search(name):
             score -= 0.3
             quality = "suspicious"
         
@@ -462,11 +522,11 @@ class FieldConfidenceScorer:
         score = 0.0
         quality = "invalid"
         
-        # Clean phone for validation
-        clean_phone = re.sub(r'[\s\.\-\(\)]', '', str(phone))
+        # Separators are not digits, so count on the phone as written
+        phone = str(phone)
         
         # Length check (7-15 digits typical)
-        digit_count = sum(1 for c in clean_phone if c.isdigit())
+        digit_count = len(phone) - len(phone.translate(_DELETE_DIGITS))
         
         if 7 <= digit_count <= 15:
             score = 0.7
@@ -478,7 +538,7 @@ class FieldConfidenceScorer:
                 quality = "complete"
             
             # Has country code
-            if clean_phone.startswith("+") or clean_phone.startswith("1"):
+            if self.PHONE_COUNTRY_CODE_PATTERN.match(phone):
                 score += 0.1
         elif digit_count > 0:
             score = 0.3
@@ -498,12 +558,11 @@ class FieldConfidenceScorer:
             score += 0.2
         
         # Common company indicators
-        indicators = ["inc", "llc", "ltd", "corp", "co", "company", "group", "international"]
-        if any(ind in company.lower() for ind in indicators):
+        if self.COMPANY_INDICATORS.search(company.lower()):
             score += 0.1
         
         # OCR error check
-        if any(pattern.search(company) for pattern in self.OCR_ERROR_PATTERNS):
+        if self.OCR_ERROR_PATTERN.search(company):
             score -= 0.2
         
         return min(max(score, 0), 1.0)
@@ -516,14 +575,7 @@ class FieldConfidenceScorer:
         score = 0.5
         
         # Common title keywords
-        title_keywords = [
-            "manager", "director", "president", "ceo", "cto", "cfo", "vp",
-            "engineer", "developer", "designer", "analyst", "consultant",
-            "agent", "specialist", "coordinator", "lead", "senior", "founder",
-            "owner", "partner", "associate", "executive", "officer"
-        ]
-        
-        if any(kw in title.lower() for kw in title_keywords):
+        if self.TITLE_KEYWORDS.search(title.lower()):
             score += 0.4
         
         # Reasonable length
@@ -554,18 +606,15 @@ class FieldConfidenceScorer:
         score = 0.4
         
         # Address indicators
-        indicators = ["street", "st", "avenue", "ave", "road", "rd", "drive", "dr",
-                     "suite", "floor", "building", "blvd", "lane", "ln", "way"]
-        
-        if any(ind in address.lower() for ind in indicators):
+        if self.ADDRESS_INDICATORS.search(address.lower()):
             score += 0.3
         
         # Zip code pattern
-        if re.search(r'\b\d{5}(?:-\d{4})?\b', address):
+        if self.ZIP_PATTERN.search(address):
             score += 0.2
         
         # State abbreviation
-        if re.search(r'\b[A-Z]{2}\b', address):
+        if self.STATE_PATTERN.search(address):
             score += 0.1
         
         return min(score, 1.0)
@@ -1,18 +1,62 @@
 """
 Enhanced OCR Extractor using your accurate EasyOCR configuration.
 """
+import importlib
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import cv2
 import numpy as np
-import easyocr
+from PIL import Image
 import uuid
 import os
 import re
 
+from ._cache import OCRResultCache
+from ._keywords import KeywordMatcher
+from .ocr_pool import compile_reader, get_pool, half_reader, _readtext
+
 logger = logging.getLogger(__name__)
 
+# EXIF orientations that swap width and height (transpose / 90° / 270°)
+_EXIF_ORIENTATION_TAG = 0x0112
+_AXIS_SWAPPING_ORIENTATIONS = {5, 6, 7, 8}
+
+# JPEG decode-time downscaling (libjpeg scales in the IDCT), largest first
+_REDUCED_READ_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+# Context-aware OCR fixes applied in order by _correct_ocr_text, each with
+# a character the text must contain for the pattern to possibly match
+_OCR_FIXES = (
+    # Smart context-aware 1 → l conversion
+    # In words that have letters around the 1, it's probably an 'l'
+    # Pattern: letter + 1 + letter (like "b1ue" → "blue")
+    (re.compile(r'([a-zA-Z])1([a-zA-Z])'), r'\1l\2', '1'),
+    # Pattern: start of word + 1 + letters (like "1ive" → "live", but not "1234")
+    (re.compile(r'\b1([a-zA-Z]{2,})'), r'l\1', '1'),
+    # Pattern: letters + 1 at end of word (like "emai1" → "email")
+    (re.compile(r'([a-zA-Z]{2,})1\b'), r'\1l', '1'),
+    # Fix double 1s that should be ll (like "wa11" → "wall")
+    (re.compile(r'([a-zA-Z])11([a-zA-Z])'), r'\1ll\2', '1'),
+    (re.compile(r'([a-zA-Z])11\b'), r'\1ll', '1'),
+    # Fix 0 → o in words (like "s0lutions" → "solutions")
+    (re.compile(r'([a-zA-Z])0([a-zA-Z])'), r'\1o\2', '0'),
+    # Fix email domains ("@acme . com", "@acme com"); a "c0m" after the
+    # dot is left to the trailing .com fix below
+    (re.compile(r'@(\w+)(?:\s*\.\s*|\s+)com\b', re.IGNORECASE), r'@\1.com', '@'),
+    # Fix website URLs
+    (re.compile(r'www\s*\.\s*', re.IGNORECASE), 'www.', '.'),
+    (re.compile(r'\.c[o0]m\b', re.IGNORECASE), '.com', '.'),
+)
+
 class OCRExtractor:
     """OCR extractor using your accurate EasyOCR setup."""
     
@@ -20,7 +64,14 @@ class OCRExtractor:
         self,
         languages: List[str] = None,
         gpu: bool = False,
-        model_dir: str = "./models"
+        model_dir: str = "./models",
+        pool_workers: int = 0,
+        cache_path: Optional[str] = None,
+        canvas_size: int = 2560,
+        compile_models: bool = False,
+        precision: str = "fp32",
+        fast_path_min_lines: int = 0,
+        fast_path_min_confidence: float = 0.6
     ):
         """
         Initialize OCR extractor.
@@ -29,28 +80,72 @@ class OCRExtractor:
             languages: List of languages for OCR
             gpu: Use GPU for OCR
             model_dir: Directory for model storage
+            pool_workers: Number of warm EasyOCR worker processes (0 = run in-process)
+            cache_path: SQLite file for caching OCR results (None = no cache)
+            canvas_size: Longest image edge fed to the EasyOCR detector
+            compile_models: torch.compile the detector/recognizer (GPU only)
+            precision: "fp32", or "fp16" to run the models in half precision (GPU only)
+            fast_path_min_lines: Try OCR on the resized image before the full
+                enhancement chain, keeping it if it yields at least this many
+                lines (0 = always enhance)
+            fast_path_min_confidence: Minimum weighted confidence for a fast
+                path result to be kept
         """
+        if precision not in ("fp32", "fp16"):
+            raise ValueError(f"Unsupported OCR precision: {precision}")
+        
         self.languages = languages or ['en']
         self.gpu = gpu
+        self.model_dir = model_dir
+        self.canvas_size = canvas_size
+        self.compile_models = compile_models
+        self.precision = precision
+        self.fast_path_min_lines = fast_path_min_lines
+        self.fast_path_min_confidence = fast_path_min_confidence
+        self._reader = None
+        self._reader_lock = threading.Lock()
+        # Per-thread OpenCV state reused across images (see _clahe)
+        self._local = threading.local()
+        self.pool = None
+        self.cache = OCRResultCache(cache_path) if cache_path else None
+        
+        # Everything besides image bytes that changes the OCR output
+        self._cache_params = {
+            "languages": self.languages,
+            "recog_network": "english_g2",
+            "detail": 1,
+            "paragraph": False,
+            "rotation_info": None,
+            "canvas_size": self.canvas_size,
+            "mag_ratio": 1.0,
+            "precision": self.precision if self.gpu else "fp32",
+        }
+        if self.fast_path_min_lines > 0:
+            self._cache_params["fast_path"] = (
+                self.fast_path_min_lines, self.fast_path_min_confidence
+            )
         
         # Create models directory
         os.makedirs(model_dir, exist_ok=True)
         
-        # Initialize EasyOCR with YOUR configuration
-        logger.info(f"Initializing EasyOCR with languages: {self.languages}")
-        try:
-            self.reader = easyocr.Reader(
-                lang_list=self.languages,
-                gpu=self.gpu,
-                model_storage_directory=model_dir,
-                download_enabled=True,
-                recog_network='english_g2',  # Better English model
-                verbose=False
-            )
-            logger.info("EasyOCR initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize EasyOCR: {e}")
-            raise
+        if pool_workers > 0:
+            # Workers each hold their own reader - no need for one here
+            logger.info(f"Initializing EasyOCR with languages: {self.languages}")
+            try:
+                self.pool = get_pool(
+                    pool_workers, self.languages, self.gpu, model_dir,
+                    compile_models, precision
+                )
+                logger.info("EasyOCR initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize EasyOCR: {e}")
+                raise
+        else:
+            # easyocr pulls in torch (seconds of import time); start importing
+            # it in the background so the reader is quicker to build on first use
+            threading.Thread(
+                target=importlib.import_module, args=("easyocr",), daemon=True
+            ).start()
         
         # Temporary directory for processed images
         self.temp_dir = Path("./temp_ocr")
@@ -198,9 +293,146 @@ class OCRExtractor:
             "Ana1yst": "Analyst",
             "Adm1n": "Admin",
         }
+        # Applied in dict order, each pass reading the previous one's output
+        # (e.g. "1obster" -> "lobster" -> "Lobster"); the lowercase wrong
+        # word lets ASCII lines skip the passes that cannot match
+        self._word_correction_res = [
+            (wrong.lower(), re.compile(re.escape(wrong), re.IGNORECASE), correct)
+            for wrong, correct in self.word_corrections.items()
+        ]
+        # One scan tells whether a line needs any word correction at all
+        self._word_correction_matcher = KeywordMatcher(
+            wrong.lower() for wrong in self.word_corrections
+        )
         
         logger.info("OCR extractor initialized with word corrections")
     
+    @property
+    def reader(self):
+        """EasyOCR reader, built (and easyocr imported) on first use."""
+        if self._reader is None:
+            with self._reader_lock:
+                if self._reader is None:
+                    # Initialize EasyOCR with YOUR configuration
+                    logger.info(f"Initializing EasyOCR with languages: {self.languages}")
+                    try:
+                        import easyocr
+                        
+                        reader = easyocr.Reader(
+                            lang_list=self.languages,
+                            gpu=self.gpu,
+                            model_storage_directory=self.model_dir,
+                            download_enabled=True,
+                            recog_network='english_g2',  # Better English model
+                            verbose=False
+                        )
+                        if self.precision == "fp16" and self.gpu:
+                            half_reader(reader)
+                        if self.compile_models and self.gpu:
+                            compile_reader(reader)
+                        self._reader = reader
+                        logger.info("EasyOCR initialized successfully")
+                    except Exception as e:
+                        logger.error(f"Failed to initialize EasyOCR: {e}")
+                        raise
+        return self._reader
+    
+    def _clahe(self):
+        """
+        Get this thread's CLAHE object, creating it on first use.
+        
+        CLAHE keeps scratch buffers on the object, so one instance is shared
+        per thread rather than across the prefetch threads.
+        """
+        clahe = getattr(self._local, "clahe", None)
+        if clahe is None:
+            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(12, 12))
+            self._local.clahe = clahe
+        return clahe
+    
+    def _target_scale(self, w: int, h: int) -> float:
+        """
+        Get the resize factor that brings an image to EasyOCR's sweet spot.
+        
+        Args:
+            w: Image width
+            h: Image height
+            
+        Returns:
+            Scale factor (1.0 = keep size)
+        """
+        # Target optimal dimensions for EasyOCR
+        target_width = 1600  # Sweet spot for EasyOCR
+        if w < target_width:
+            scale = target_width / w
+        elif w > 2400:  # Too large, scale down
+            scale = 2400 / w
+        else:
+            scale = 1.0
+        
+        # Never exceed the detector canvas - EasyOCR would only resize
+        # it down again inside readtext
+        return min(scale, self.canvas_size / max(h, w))
+    
+    def _read_image(self, image_path: Path) -> Optional[np.ndarray]:
+        """
+        Decode an image, letting libjpeg shrink large JPEGs while decoding.
+        
+        Args:
+            image_path: Path to image
+            
+        Returns:
+            BGR image, or None if it cannot be read
+        """
+        flags = cv2.IMREAD_COLOR
+        try:
+            # Header-only read - PIL does not decode pixels here
+            with Image.open(image_path) as header:
+                if header.format == "JPEG":
+                    w, h = header.size
+                    # cv2.imread applies the EXIF rotation, so size the
+                    # decode for the upright image
+                    orientation = header.getexif().get(_EXIF_ORIENTATION_TAG, 1)
+                    if orientation in _AXIS_SWAPPING_ORIENTATIONS:
+                        w, h = h, w
+                    scale = self._target_scale(w, h)
+                    for factor, reduced_flag in _REDUCED_READ_FLAGS:
+                        # Only reduce while the decode stays at least target size
+                        if scale * factor <= 1.0:
+                            flags = reduced_flag
+                            break
+        except Exception:
+            pass
+        
+        return cv2.imread(str(image_path), flags)
+    
+    def _read_resized(self, image_path: Path) -> np.ndarray:
+        """
+        Decode an image and resize it to the OCR target size.
+        
+        Args:
+            image_path: Path to image
+            
+        Returns:
+            Resized BGR image
+        """
+        img = self._read_image(image_path)
+        if img is None:
+            raise ValueError(f"Cannot read image: {image_path}")
+        
+        # Enhanced resizing with aspect ratio preservation
+        h, w = img.shape[:2]
+        scale = self._target_scale(w, h)
+        
+        if scale != 1.0:
+            new_w = round(w * scale)
+            new_h = round(h * scale)
+            interpolation = cv2.INTER_CUBIC if scale > 1.0 else cv2.INTER_AREA
+            img = cv2.resize(img, (new_w, new_h), interpolation=interpolation)
+        
+        logger.debug(f"Resized from {w}x{h} to {img.shape[1]}x{img.shape[0]}")
+        return img
+    
     def _preprocess_image(self, image_path: Path) -> str:
         """
         Preprocess image using YOUR accurate preprocessing.
@@ -212,38 +444,18 @@ class OCRExtractor:
             Path to preprocessed temporary image
         """
         try:
-            # Read image
-            img = cv2.imread(str(image_path))
-            if img is None:
-                raise ValueError(f"Cannot read image: {image_path}")
-            
-            # Step 1: Enhanced resizing with aspect ratio preservation
-            h, w = img.shape[:2]
-            
-            # Target optimal dimensions for EasyOCR
-            target_width = 1600  # Sweet spot for EasyOCR
-            if w < target_width:
-                scale = target_width / w
-                new_w = target_width
-                new_h = int(h * scale)
-                img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_CUBIC)
-            elif w > 2400:  # Too large, scale down
-                scale = 2400 / w
-                new_w = int(w * scale)
-                new_h = int(h * scale)
-                img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
-            
-            logger.debug(f"Resized from {w}x{h} to {img.shape[1]}x{img.shape[0]}")
+            # Step 1: Read and resize
+            img = self._read_resized(image_path)
             
             # Step 2: Convert to grayscale with optimal method
             gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
             
-            # Step 3: Advanced denoising
-            gray = cv2.fastNlMeansDenoising(gray, None, h=8, templateWindowSize=7, searchWindowSize=21)
+            # Step 3: Edge-preserving denoise (bilateral is O(d²) per pixel,
+            # far cheaper than the NLMeans neighbourhood search it replaces)
+            gray = cv2.bilateralFilter(gray, d=5, sigmaColor=50, sigmaSpace=50)
             
             # Step 4: Adaptive contrast enhancement
-            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(12, 12))
-            gray = clahe.apply(gray)
+            gray = self._clahe().apply(gray)
             
             # Step 5: Enhanced sharpening with edge preservation
             # Gaussian blur to find edges
@@ -283,37 +495,25 @@ class OCRExtractor:
         Returns:
             Corrected text
         """
-        # Apply word-level corrections (specific known patterns)
-        for wrong, correct in self.word_corrections.items():
-            # Case-insensitive replacement but preserve case when possible
-            text = re.sub(re.escape(wrong), correct, text, flags=re.IGNORECASE)
-        
-        # Smart context-aware 1 → l conversion
-        # In words that have letters around the 1, it's probably an 'l'
-        # Pattern: letter + 1 + letter (like "b1ue" → "blue")
-        text = re.sub(r'([a-zA-Z])1([a-zA-Z])', r'\1l\2', text)
-        
-        # Pattern: start of word + 1 + letters (like "1ive" → "live", but not "1234")
-        text = re.sub(r'\b1([a-zA-Z]{2,})', r'l\1', text)
-        
-        # Pattern: letters + 1 at end of word (like "emai1" → "email")
-        text = re.sub(r'([a-zA-Z]{2,})1\b', r'\1l', text)
-        
-        # Fix double 1s that should be ll (like "wa11" → "wall")
-        text = re.sub(r'([a-zA-Z])11([a-zA-Z])', r'\1ll\2', text)
-        text = re.sub(r'([a-zA-Z])11\b', r'\1ll', text)
-        
-        # Fix 0 → o in words (like "s0lutions" → "solutions")
-        text = re.sub(r'([a-zA-Z])0([a-zA-Z])', r'\1o\2', text)
+        # Apply word-level corrections (specific known patterns). On an
+        # ASCII line a case-insensitive match is a substring of the
+        # lowercased line, so only the passes that can match are run;
+        # other lines take every pass, as IGNORECASE folds more than lower()
+        if not text.isascii():
+            for _, pattern, correct in self._word_correction_res:
+                text = pattern.sub(correct, text)
+        elif self._word_correction_matcher.search(text.lower()):
+            lower = text.lower()
+            for wrong, pattern, correct in self._word_correction_res:
+                if wrong in lower:
+                    text = pattern.sub(correct, text)
+                    lower = text.lower()
         
-        # Fix email domains
-        text = re.sub(r'@(\w+)\s*\.\s*com\b', r'@\1.com', text, flags=re.IGNORECASE)
-        text = re.sub(r'@(\w+)\s+com\b', r'@\1.com', text, flags=re.IGNORECASE)
-        text = re.sub(r'(\w+)@(\w+)\.c[o0]m\b', r'\1@\2.com', text, flags=re.IGNORECASE)
-        
-        # Fix website URLs
-        text = re.sub(r'www\s*\.\s*', 'www.', text, flags=re.IGNORECASE)
-        text = re.sub(r'\.c[o0]m\b', '.com', text, flags=re.IGNORECASE)
+        # Context-aware character fixes (see _OCR_FIXES); most lines have
+        # no digits or '@', so most of these passes are skipped outright
+        for pattern, replacement, required in _OCR_FIXES:
+            if required in text:
+                text = pattern.sub(replacement, text)
         
         # Remove extra spaces
         text = ' '.join(text.split())
@@ -345,24 +545,21 @@ class OCRExtractor:
         
         return cleaned_lines
     
-    def extract_text(self, image_path: Path) -> Dict:
+    def _load_for_ocr(self, image_path: Path) -> np.ndarray:
         """
-        Extract text from image using YOUR accurate OCR.
+        Preprocess an image and load it in the format EasyOCR expects.
         
         Args:
             image_path: Path to image
             
         Returns:
-            Dictionary with extraction results
+            BGR uint8 image ready for readtext
         """
+        # Step 1: Preprocess image for optimal EasyOCR performance
+        processed_path = self._preprocess_image(image_path)
+        
         try:
-            logger.info(f"Extracting text from {image_path}")
-            
-            # Step 1: Preprocess image for optimal EasyOCR performance
-            processed_path = self._preprocess_image(image_path)
-            
-            # Step 2: Run OCR with safe settings to avoid numpy/scipy shape errors
-            # Read image properly first
+            # Step 2: Read image properly to avoid numpy/scipy shape errors
             img = cv2.imread(str(processed_path))
             if img is None:
                 raise ValueError(f"Could not load image: {processed_path}")
@@ -379,70 +576,324 @@ class OCRExtractor:
             if img.dtype != np.uint8:
                 img = img.astype(np.uint8)
             
-            results = self.reader.readtext(
-                img,
-                detail=1,  # Get bounding boxes and confidence scores
-                paragraph=False,  # Get individual text regions
-                rotation_info=None  # Disable rotation to avoid shape errors
-            )
-            
-            # Step 3: Enhanced result processing
-            lines = []
-            confidences = []
-            
-            # Sort results by Y coordinate (top to bottom) for better line ordering
-            results.sort(key=lambda x: x[0][0][1])  # Sort by top-left Y coordinate
-            
-            for bbox, text, confidence in results:
-                text = text.strip()
-                # Only include text with decent confidence and reasonable length
-                if confidence >= 0.15 and len(text) >= 2:
-                    lines.append(text)
-                    confidences.append(confidence)
-            
-            # Step 4: Advanced text post-processing
-            cleaned_lines = self._postprocess_text(lines)
-            
-            # Step 5: Calculate weighted average confidence (higher weights for longer text)
-            if confidences:
-                weights = [len(line) for line in lines]
-                weighted_conf = sum(c * w for c, w in zip(confidences, weights))
-                total_weight = sum(weights)
-                avg_confidence = weighted_conf / total_weight if total_weight > 0 else sum(confidences) / len(confidences)
-            else:
-                avg_confidence = 0.0
-            
-            # Step 6: Clean up temp file if we created one
+            return img
+        finally:
+            # Clean up temp file if we created one
             if processed_path != str(image_path):
                 try:
                     os.remove(processed_path)
                 except:
                     pass
+    
+    def _readtext(self, img: np.ndarray) -> List:
+        """
+        Run EasyOCR on a prepared image.
+        
+        Args:
+            img: BGR uint8 image from _load_for_ocr or _read_resized
+            
+        Returns:
+            EasyOCR results as (bbox, text, confidence) tuples
+        """
+        if self.pool is not None:
+            # Warm worker process runs the same readtext call
+            return self.pool.apply(_readtext, (img, self.canvas_size))
+        
+        return self.reader.readtext(
+            img,
+            detail=1,  # Get bounding boxes and confidence scores
+            paragraph=False,  # Get individual text regions
+            rotation_info=None,  # Disable rotation to avoid shape errors
+            canvas_size=self.canvas_size,  # Image is already sized to fit
+            mag_ratio=1.0
+        )
+    
+    def _prefetch(self, image_path: Path) -> Tuple[Optional[bytes], Optional[List], Optional[np.ndarray]]:
+        """
+        Do all the work for an image that happens before inference.
+        
+        Args:
+            image_path: Path to image
             
-            logger.info(f"Extracted {len(cleaned_lines)} lines with {avg_confidence:.2%} confidence")
+        Returns:
+            Tuple of (cache key, cached results, prepared image); the image is
+            None on a cache hit
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = OCRResultCache.make_key(
+                Path(image_path).read_bytes(), self._cache_params
+            )
+            results = self.cache.get(cache_key)
+            if results is not None:
+                # Identical cards skip preprocessing and inference entirely
+                logger.debug(f"OCR cache hit for {image_path}")
+                return cache_key, results, None
+        
+        if self.fast_path_min_lines > 0:
+            # Speculate that the card reads fine without enhancement
+            return cache_key, None, self._read_resized(image_path)
+        
+        return cache_key, None, self._load_for_ocr(image_path)
+    
+    def _fast_path_ok(self, results: List) -> bool:
+        """
+        Check whether OCR on the unenhanced image is good enough to keep.
+        
+        Uses the same line filter and confidence weighting as _build_result.
+        
+        Args:
+            results: EasyOCR results as (bbox, text, confidence) tuples
             
-            if not cleaned_lines:
-                return {
-                    "success": False,
-                    "error": "No text extracted from image",
-                    "raw_text": "",
-                    "confidence": 0.0,
-                    "method": "easyocr_enhanced"
-                }
+        Returns:
+            True if the results clear both fast path thresholds
+        """
+        kept = [
+            (len(text.strip()), confidence)
+            for _, text, confidence in results
+            if confidence >= 0.15 and len(text.strip()) >= 2
+        ]
+        if len(kept) < self.fast_path_min_lines:
+            return False
+        
+        total_weight = sum(w for w, _ in kept)
+        weighted_conf = sum(w * c for w, c in kept) / total_weight
+        return weighted_conf >= self.fast_path_min_confidence
+    
+    def _build_result(self, results: List) -> Dict:
+        """
+        Turn raw EasyOCR results into the extraction result dictionary.
+        
+        Args:
+            results: EasyOCR results as (bbox, text, confidence) tuples
             
+        Returns:
+            Dictionary with extraction results
+        """
+        # Step 3: Enhanced result processing
+        lines = []
+        confidences = []
+        
+        # Sort results by Y coordinate (top to bottom) for better line ordering
+        results.sort(key=lambda x: x[0][0][1])  # Sort by top-left Y coordinate
+        
+        for bbox, text, confidence in results:
+            text = text.strip()
+            # Only include text with decent confidence and reasonable length
+            if confidence >= 0.15 and len(text) >= 2:
+                lines.append(text)
+                confidences.append(confidence)
+        
+        # Step 4: Advanced text post-processing
+        cleaned_lines = self._postprocess_text(lines)
+        
+        # Step 5: Calculate weighted average confidence (higher weights for longer text)
+        if confidences:
+            weights = [len(line) for line in lines]
+            weighted_conf = sum(c * w for c, w in zip(confidences, weights))
+            total_weight = sum(weights)
+            avg_confidence = weighted_conf / total_weight if total_weight > 0 else sum(confidences) / len(confidences)
+        else:
+            avg_confidence = 0.0
+        
+        logger.info(f"Extracted {len(cleaned_lines)} lines with {avg_confidence:.2%} confidence")
+        
+        if not cleaned_lines:
             return {
-                "success": True,
-                "raw_text": "\n".join(cleaned_lines),
-                "confidence": avg_confidence,
+                "success": False,
+                "error": "No text extracted from image",
+                "raw_text": "",
+                "confidence": 0.0,
                 "method": "easyocr_enhanced"
             }
+        
+        return {
+            "success": True,
+            "raw_text": "\n".join(cleaned_lines),
+            "confidence": avg_confidence,
+            "method": "easyocr_enhanced"
+        }
+    
+    def _complete(
+        self,
+        image_path: Path,
+        prefetched: Tuple[Optional[bytes], Optional[List], Optional[np.ndarray]]
+    ) -> Dict:
+        """
+        Run inference on a prefetched image (if needed) and build its result.
+        
+        Args:
+            image_path: Path to image
+            prefetched: Output of _prefetch
+            
+        Returns:
+            Dictionary with extraction results
+        """
+        cache_key, results, img = prefetched
+        
+        if results is None:
+            results = self._readtext(img)
+            if self.fast_path_min_lines > 0 and not self._fast_path_ok(results):
+                # Raw image was not enough - retry with full enhancement
+                logger.debug(f"Fast path rejected for {image_path}, enhancing")
+                results = self._readtext(self._load_for_ocr(image_path))
+            if cache_key is not None:
+                self.cache.set(cache_key, results)
+        
+        return self._build_result(results)
+    
+    @staticmethod
+    def _error_result(e: Exception) -> Dict:
+        """Build the extraction result for a failed image."""
+        return {
+            "success": False,
+            "error": str(e),
+            "raw_text": "",
+            "confidence": 0.0,
+            "method": "easyocr"
+        }
+    
+    def extract_text(self, image_path: Path) -> Dict:
+        """
+        Extract text from image using YOUR accurate OCR.
+        
+        Args:
+            image_path: Path to image
+            
+        Returns:
+            Dictionary with extraction results
+        """
+        try:
+            logger.info(f"Extracting text from {image_path}")
+            return self._complete(image_path, self._prefetch(image_path))
             
         except Exception as e:
             logger.error(f"OCR extraction error: {e}", exc_info=True)
-            return {
-                "success": False,
-                "error": str(e),
-                "raw_text": "",
-                "confidence": 0.0,
-                "method": "easyocr"
-            }
\ No newline at end of file
+            return self._error_result(e)
+    
+    def extract_text_stream(
+        self,
+        image_paths: Iterable[Path],
+        prefetch: int = 2
+    ) -> Iterator[Tuple[Path, Dict]]:
+        """
+        Extract text from many images, preprocessing ahead of inference.
+        
+        Up to `prefetch` upcoming images are decoded and preprocessed on
+        background threads while the current one is in readtext (torch
+        releases the GIL during inference), so the model is not left idle
+        waiting on image I/O.
+        
+        Args:
+            image_paths: Paths to images, in order
+            prefetch: Number of images to prepare ahead of inference
+            
+        Yields:
+            (image_path, extraction result) tuples in input order
+        """
+        paths = iter(image_paths)
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=max(prefetch, 1)) as executor:
+            # Prime the queue, then top it up as each image is consumed
+            for path in islice(paths, max(prefetch, 1)):
+                pending.append((path, executor.submit(self._prefetch, path)))
+            
+            while pending:
+                image_path, future = pending.popleft()
+                for path in islice(paths, 1):
+                    pending.append((path, executor.submit(self._prefetch, path)))
+                
+                try:
+                    logger.info(f"Extracting text from {image_path}")
+                    result = self._complete(image_path, future.result())
+                except Exception as e:
+                    logger.error(f"OCR extraction error: {e}", exc_info=True)
+                    result = self._error_result(e)
+                
+                yield image_path, result
+    
+    def extract_text_batch(
+        self,
+        image_paths: List[Path],
+        max_batch_size: int = 16,
+        prefetch: int = 8
+    ) -> List[Dict]:
+        """
+        Extract text from many images, batching GPU inference by image size.
+        
+        Prepared images are bucketed by size (64px steps) and each bucket is
+        sent to EasyOCR's readtext_batched in groups of up to max_batch_size,
+        so the GPU sees full batches of one shape. On CPU or with a worker
+        pool there is nothing to gain and images are read one at a time.
+        Images are read and prepared on up to `prefetch` threads, so disk
+        reads and decodes overlap instead of stacking up per image.
+        
+        Args:
+            image_paths: Paths to images
+            max_batch_size: Most images per readtext_batched call
+            prefetch: Number of threads reading and preparing images
+            
+        Returns:
+            Extraction results in input order
+        """
+        if not self.gpu or self.pool is not None:
+            return [self.extract_text(path) for path in image_paths]
+        
+        results: List[Optional[Dict]] = [None] * len(image_paths)
+        prefetched = {}
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        
+        with ThreadPoolExecutor(max_workers=max(min(prefetch, len(image_paths)), 1)) as executor:
+            futures = [executor.submit(self._prefetch, path) for path in image_paths]
+        
+        for i, future in enumerate(futures):
+            try:
+                prefetched[i] = future.result()
+            except Exception as e:
+                logger.error(f"OCR extraction error: {e}", exc_info=True)
+                results[i] = self._error_result(e)
+                continue
+            img = prefetched[i][2]
+            if img is not None:
+                h, w = img.shape[:2]
+                buckets.setdefault((max(round(h / 64), 1), max(round(w / 64), 1)), []).append(i)
+        
+        raw = {i: cached for i, (_, cached, _) in prefetched.items() if cached is not None}
+        for (rows, cols), indices in buckets.items():
+            for start in range(0, len(indices), max_batch_size):
+                group = indices[start:start + max_batch_size]
+                try:
+                    batch = self.reader.readtext_batched(
+                        [prefetched[i][2] for i in group],
+                        n_width=cols * 64,
+                        n_height=rows * 64,
+                        batch_size=len(group),
+                        detail=1,
+                        paragraph=False,
+                        canvas_size=self.canvas_size,
+                        mag_ratio=1.0
+                    )
+                except Exception as e:
+                    logger.error(f"Batched OCR error: {e}", exc_info=True)
+                    for i in group:
+                        results[i] = self._error_result(e)
+                    continue
+                raw.update(zip(group, batch))
+        
+        for i, ocr_results in raw.items():
+            image_path = image_paths[i]
+            cache_key, cached, _ = prefetched[i]
+            try:
+                if cached is None:
+                    if self.fast_path_min_lines > 0 and not self._fast_path_ok(ocr_results):
+                        logger.debug(f"Fast path rejected for {image_path}, enhancing")
+                        ocr_results = self._readtext(self._load_for_ocr(image_path))
+                    if cache_key is not None:
+                        self.cache.set(cache_key, ocr_results)
+                results[i] = self._build_result(ocr_results)
+            except Exception as e:
+                logger.error(f"OCR extraction error: {e}", exc_info=True)
+                results[i] = self._error_result(e)
+        
+        return results
@@ -0,0 +1,177 @@
+"""
+Process-level EasyOCR worker pool.
+
+Each worker builds one EasyOCR Reader at startup and keeps it warm, so the
+~8s model load is paid once per worker instead of once per cold call.
+"""
+import logging
+import multiprocessing
+import multiprocessing.pool
+import threading
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Reader owned by the current worker process (set by _init_worker_reader)
+_WORKER_READER = None
+
+# Pools shared across the process, keyed by their reader configuration
+_POOLS: Dict[Tuple, multiprocessing.pool.Pool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def compile_reader(reader) -> None:
+    """
+    Wrap a reader's detector and recognizer with torch.compile.
+
+    Only used on CUDA: CPU readers run int8 dynamically quantized modules,
+    which torch.compile does not handle. Compilation happens on the first
+    readtext call for each new input shape.
+
+    Args:
+        reader: easyocr.Reader to compile in place
+    """
+    import torch
+
+    for attr in ("detector", "recognizer"):
+        setattr(
+            reader,
+            attr,
+            torch.compile(getattr(reader, attr), mode="reduce-overhead", dynamic=False)
+        )
+
+
+def half_reader(reader) -> None:
+    """
+    Convert a reader's detector and recognizer to float16 weights.
+
+    Only used on CUDA. EasyOCR builds float32 input tensors, so each model
+    is wrapped to cast floating-point inputs to half precision and its
+    outputs back to float32 for the numpy/OpenCV post-processing.
+
+    Args:
+        reader: easyocr.Reader to convert in place
+    """
+    import torch
+
+    class _HalfPrecision(torch.nn.Module):
+        def __init__(self, module):
+            super().__init__()
+            self.module = module.half()
+
+        def forward(self, *args):
+            args = [a.half() if torch.is_floating_point(a) else a for a in args]
+            out = self.module(*args)
+            if isinstance(out, tuple):
+                return tuple(o.float() for o in out)
+            return out.float()
+
+    for attr in ("detector", "recognizer"):
+        setattr(reader, attr, _HalfPrecision(getattr(reader, attr)))
+
+
+def _init_worker_reader(
+    languages: List[str],
+    gpu: bool,
+    model_dir: str,
+    compile_models: bool = False,
+    precision: str = "fp32"
+) -> None:
+    """
+    Build the EasyOCR reader for this worker process.
+
+    Args:
+        languages: List of languages for OCR
+        gpu: Use GPU for OCR
+        model_dir: Directory for model storage
+        compile_models: torch.compile the detector/recognizer (GPU only)
+        precision: "fp16" runs the models in half precision (GPU only)
+    """
+    global _WORKER_READER
+    import easyocr
+
+    _WORKER_READER = easyocr.Reader(
+        lang_list=languages,
+        gpu=gpu,
+        model_storage_directory=model_dir,
+        download_enabled=True,
+        recog_network='english_g2',
+        verbose=False
+    )
+    if precision == "fp16" and gpu:
+        half_reader(_WORKER_READER)
+    if compile_models and gpu:
+        compile_reader(_WORKER_READER)
+
+
+def _readtext(img: np.ndarray, canvas_size: int = 2560) -> List:
+    """
+    Run OCR on an image with the worker's warm reader.
+
+    Args:
+        img: BGR uint8 image
+        canvas_size: Longest image edge fed to the detector
+
+    Returns:
+        EasyOCR results as (bbox, text, confidence) tuples
+    """
+    return _WORKER_READER.readtext(
+        img,
+        detail=1,
+        paragraph=False,
+        rotation_info=None,
+        canvas_size=canvas_size,
+        mag_ratio=1.0
+    )
+
+
+def get_pool(
+    n_workers: int,
+    languages: List[str],
+    gpu: bool = False,
+    model_dir: str = "./models",
+    compile_models: bool = False,
+    precision: str = "fp32"
+) -> multiprocessing.pool.Pool:
+    """
+    Get (or create) the shared worker pool for a reader configuration.
+
+    Uses the 'spawn' start method so CUDA state is never forked.
+
+    Args:
+        n_workers: Number of worker processes
+        languages: List of languages for OCR
+        gpu: Use GPU for OCR
+        model_dir: Directory for model storage
+        compile_models: torch.compile the detector/recognizer (GPU only)
+        precision: "fp16" runs the models in half precision (GPU only)
+
+    Returns:
+        Pool whose workers each hold a warm EasyOCR reader
+    """
+    key = (n_workers, tuple(languages), gpu, model_dir, compile_models, precision)
+
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            logger.info(f"Starting EasyOCR worker pool with {n_workers} workers")
+            ctx = multiprocessing.get_context("spawn")
+            pool = ctx.Pool(
+                processes=n_workers,
+                initializer=_init_worker_reader,
+                initargs=(list(languages), gpu, model_dir, compile_models, precision)
+            )
+            _POOLS[key] = pool
+
+    return pool
+
+
+def shutdown_pools() -> None:
+    """Terminate all worker pools started by this process."""
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.terminate()
+            pool.join()
+        _POOLS.clear()
@@ -1,17 +1,56 @@
 import re
 import logging
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
+
+from ._keywords import KeywordCategories, KeywordMatcher
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Use RE2 (linear-time DFA, no backtracking) for the contact patterns when
+# google-re2 is installed; the stdlib engine is a drop-in fallback.
+try:
+    import re2 as _pattern_re
+    RE2_AVAILABLE = True
+except ImportError:
+    _pattern_re = re
+    RE2_AVAILABLE = False
+
+
+def _compile_pattern_set(patterns: Dict[str, Any]) -> Optional[Any]:
+    """
+    Build an RE2 set that reports which of the patterns occur in a text.
+
+    Args:
+        patterns: Compiled patterns keyed by name, in set index order
+
+    Returns:
+        Compiled re2.Set, or None when google-re2 is not installed
+    """
+    if not RE2_AVAILABLE:
+        return None
+    pattern_set = _pattern_re.Set.SearchSet()
+    for pattern in patterns.values():
+        pattern_set.Add(pattern.pattern)
+    pattern_set.Compile()
+    return pattern_set
+
+
+# str.translate table that deletes ASCII digits (one C-level pass per string)
+_DELETE_DIGITS = str.maketrans("", "", "0123456789")
+
+# str.translate table that drops the punctuation allowed inside name words
+_DELETE_NAME_PUNCTUATION = str.maketrans("", "", ",.")
+
 
 # =========================
 # DATA MODEL
 # =========================
 
-@dataclass
+@dataclass(slots=True)
 class ContactData:
     name: Optional[str] = None
     first_name: Optional[str] = None
@@ -50,16 +89,169 @@ class ContactData:
 # =========================
 
 class ContactParser:
+    # Compiled once at import and shared by every parser instance
+    PATTERNS = {
+        # Local part and domain are bounded (RFC 5321 limits) so an
+        # unanchored search costs O(n), not O(n^2), on long junk runs
+        "email": _pattern_re.compile(r"[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,}"),
+        # BETTER phone pattern - handles international, extensions, etc.
+        "phone": _pattern_re.compile(r"[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}"),
+        # Host label bounded to the DNS limit of 63 for the same reason
+        "website": _pattern_re.compile(r"(https?://)?(?:www\.)?[a-zA-Z0-9-]{1,63}\.[a-zA-Z]{2,}(?:/[^\s]*)?"),
+        "linkedin": _pattern_re.compile(r"(?:linkedin\.com/in/|linkedin\.com/company/)[^\s]+"),
+        "twitter": _pattern_re.compile(r"(?:twitter\.com/|@)[A-Za-z0-9_]+"),
+        "zip": _pattern_re.compile(r"\b\d{5}(?:-\d{4})?\b"),
+    }
+
+    # All PATTERNS in one RE2 DFA, so a single scan of the card text tells
+    # which extractors can find anything (None without google-re2)
+    _PATTERN_NAMES = tuple(PATTERNS)
+    _PATTERN_SET = _compile_pattern_set(PATTERNS)
+
+    # Substrings a card needs (any one of) for each pattern to possibly
+    # match - the cheap prescan used when _PATTERN_SET is None
+    _PATTERN_REQUIRES = {
+        "email": ("@",),
+        "phone": tuple("0123456789"),
+        "website": (".",),
+        "linkedin": ("linkedin.com/",),
+        "twitter": ("@", "twitter.com/"),
+        "zip": tuple("0123456789"),
+    }
+
+    # Company keywords that indicate this is NOT a person's name
+    NAME_COMPANY_KEYWORDS = [
+        "solutions", "technologies", "technology", "systems", "group",
+        "corporation", "company", "corp", "inc", "llc", "ltd", "co",
+        "enterprises", "associates", "partners", "consulting", "services",
+        "international", "global", "worldwide", "industries", "holdings",
+        "capital", "investments", "financial", "bank", "credit", "insurance",
+        "real estate", "construction", "development", "manufacturing",
+        "communications", "telecommunications", "media", "marketing",
+        "consulting", "advisory", "management", "logistics", "transport",
+        "healthcare", "medical", "dental", "legal", "law", "firm",
+        "restaurant", "hotel", "retail", "store", "shop", "market",
+        "business card", "card", "test", "sample", "demo", "wave"
+    ]
+
+    # Title keywords that might appear with names
+    NAME_TITLE_KEYWORDS = [
+        "agent", "engineer", "developer", "manager", "director",
+        "consultant", "designer", "president", "founder", "chairman",
+        "captain", "officer", "ceo", "cto", "cfo", "vp", "vice president",
+        "specialist", "analyst", "coordinator", "supervisor", "lead",
+        "senior", "junior", "assistant", "associate", "principal", "chief"
+    ]
+
+    # Job title keywords
+    TITLE_KEYWORDS = [
+        "real estate agent", "agent", "engineer", "developer",
+        "manager", "director", "captain", "founder", "chairman",
+        "consultant", "designer", "president", "ceo", "cto", "cfo",
+        "vice president", "vp", "officer", "specialist", "analyst"
+    ]
+
+    # Weak indicators (context-dependent)
+    WEAK_COMPANY_INDICATORS = [
+        "tech", "software", "design", "creative", "digital", "studio",
+        "center", "clinic", "hospital", "medical", "legal", "law",
+        "restaurant", "hotel", "retail", "construction", "engineering",
+        "marketing", "communications", "real estate", "automotive",
+        "insurance", "bank", "credit"
+    ]
+
+    # Skip patterns (never company names)
+    COMPANY_SKIP_PATTERNS = [
+        "business card", "calling card", "test", "sample", "demo",
+        "card", "front", "back", "side"
+    ]
+
+    # Common first names to help identify person names (expanded)
+    COMMON_FIRST_NAMES = frozenset({
+        "james", "robert", "john", "michael", "david", "william", "richard",
+        "thomas", "christopher", "charles", "daniel", "matthew", "anthony",
+        "mark", "donald", "steven", "paul", "joshua", "kenneth", "kevin",
+        "brian", "george", "edward", "ronald", "timothy", "jason", "jeffrey",
+        "ryan", "jacob", "gary", "nicholas", "eric", "jonathan", "stephen",
+        "mary", "patricia", "jennifer", "linda", "elizabeth", "barbara",
+        "susan", "jessica", "sarah", "karen", "nancy", "lisa", "betty",
+        "helen", "sandra", "donna", "carol", "ruth", "sharon", "michelle",
+        "laura", "sarah", "kimberly", "deborah", "dorothy", "amy", "angela",
+        "brenda", "emma", "olivia", "cynthia", "marie", "janet", "catherine",
+        "frances", "christine", "samantha", "debra", "rachel", "carolyn",
+        "virginia", "heather", "diane", "julie", "joyce", "anna", "grace",
+        "alex", "alexander", "alexandra", "andrew", "andy", "ben", "benjamin",
+        "bill", "bob", "bobby", "chris", "christine", "christina", "dan",
+        "dave", "dennis", "frank", "fred", "greg", "gregory", "jack", 
+        "jake", "jim", "joe", "joseph", "kate", "katherine", "kelly",
+        "ken", "kevin", "kim", "kimberly", "larry", "laura", "linda",
+        "lisa", "margaret", "maria", "marie", "mark", "martin", "matt",
+        "matthew", "max", "mike", "nancy", "nick", "nicholas", "pat",
+        "patricia", "paul", "peter", "phil", "philip", "rick", "rob",
+        "robert", "sam", "samuel", "sara", "scott", "steve", "steven",
+        "susan", "tom", "thomas", "tim", "timothy", "tony", "william"
+    })
+
+    # Strong company indicators (must match exactly or as word)
+    STRONG_COMPANY_INDICATORS = [
+        "inc", "llc", "ltd", "corp", "corporation", "company", "co",
+        "technologies", "systems", "group", "solutions", "associates",
+        "partners", "enterprises", "consulting", "services", "holdings",
+        "international", "global", "industries", "manufacturing",
+        "communications", "media", "healthcare", "financial", "capital",
+        "investments", "management", "logistics", "development"
+    ]
+
+    # Base score of each name candidate kind (see _name_score)
+    NAME_PRIORITY_SCORES = {'high': 10, 'with_title': 8, 'medium': 5}
+
+    # Base score of each company candidate kind (see _company_score)
+    COMPANY_PRIORITY_SCORES = {'strong': 10, 'caps': 5, 'weak': 3, 'multi_word': 2}
+
+    # Name-like line a company line should not look like, as one pattern:
+    # First Last, First M. Last, or First Middle Last
+    NAME_LIKE_PATTERN = re.compile(
+        r'^[A-Z][a-z]+ (?:[A-Z]\. |[A-Z][a-z]+ )?[A-Z][a-z]+$'
+    )
+
+    # One-pass matchers over the keyword lists above
+    _name_company_matcher = KeywordMatcher(NAME_COMPANY_KEYWORDS)
+    _name_title_matcher = KeywordMatcher(NAME_TITLE_KEYWORDS)
+    _title_matcher = KeywordMatcher(TITLE_KEYWORDS)
+
+    # Strong indicators as whole words (singular or plural)
+    _STRONG_INDICATOR_WORDS = frozenset(
+        STRONG_COMPANY_INDICATORS + [i + "s" for i in STRONG_COMPANY_INDICATORS]
+    )
+
+    # Keyword categories _extract_company checks each line for, found in
+    # one scan: skip words, strong indicators next to a dot ("acme.inc",
+    # "corp.") and weak indicators
+    _company_line_matcher = KeywordCategories({
+        "skip": COMPANY_SKIP_PATTERNS,
+        "strong_dot": ["." + i for i in STRONG_COMPANY_INDICATORS]
+                      + [i + "." for i in STRONG_COMPANY_INDICATORS],
+        "weak": WEAK_COMPANY_INDICATORS,
+    })
+
+    # The extractors only scan the first MAX_SCAN_CHARS of longer OCR text
+    # (raw_text keeps all of it), bounding the regex work; the line-by-line
+    # name/title/company heuristics only look at the first MAX_SCAN_LINES
+    MAX_SCAN_CHARS = 4096
+    MAX_SCAN_LINES = 24
+
+    # Number of distinct OCR texts whose parse result is kept, so retries
+    # and re-uploads of the same card skip the heuristics
+    PARSE_CACHE_SIZE = 1024
+
+    # Smallest batch parse_batch spreads over worker processes; below it,
+    # starting the workers costs more than parsing
+    PARALLEL_BATCH_MIN = 1000
+
     def __init__(self):
-        self.patterns = {
-            "email": re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"),
-            # BETTER phone pattern - handles international, extensions, etc.
-            "phone": re.compile(r"[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}"),
-            "website": re.compile(r"(?:https?://)?(?:www\.)?[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:/[^\s]*)?"),
-            "linkedin": re.compile(r"(?:linkedin\.com/in/|linkedin\.com/company/)[^\s]+"),
-            "twitter": re.compile(r"(?:twitter\.com/|@)[A-Za-z0-9_]+"),
-            "zip": re.compile(r"\b\d{5}(?:-\d{4})?\b"),
-        }
+        self.patterns = self.PATTERNS
+        # Per instance, so cached results are dropped with the parser
+        self._parse_text_cached = lru_cache(maxsize=self.PARSE_CACHE_SIZE)(self._parse_text)
 
     # =========================
     # PIPELINE API
@@ -75,33 +267,92 @@ class ContactParser:
         contact.confidence_score = max(base_conf * ocr_confidence, 0.35)
         return contact
 
+    def parse_batch(
+        self,
+        texts: List[str],
+        ocr_confidence: float = 1.0,
+        workers: int = 1
+    ) -> List[ContactData]:
+        """
+        Parse many OCR texts with one parser and its shared compiled patterns.
+
+        Args:
+            texts: OCR texts to parse
+            ocr_confidence: OCR confidence applied to every text
+            workers: Worker processes to spread the batch over; batches
+                smaller than PARALLEL_BATCH_MIN are always parsed in-process
+
+        Returns:
+            Parsed contacts, in the order of texts
+        """
+        if workers > 1 and len(texts) >= self.PARALLEL_BATCH_MIN:
+            # Parsing is pure-Python CPU work, so threads would share the GIL
+            chunksize = max(1, len(texts) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_parse_worker,
+                initargs=(type(self),)
+            ) as executor:
+                return list(executor.map(
+                    _parse_in_worker, texts, [ocr_confidence] * len(texts),
+                    chunksize=chunksize
+                ))
+
+        parse = self.parse
+        return [parse(text, ocr_confidence) for text in texts]
+
     def parse_from_image_text(self, text: str) -> List[ContactData]:
+        # Contacts are mutable, so hand out copies of the cached ones
+        return [replace(contact) for contact in self._parse_text_cached(text)]
+
+    def _parse_text(self, text: str) -> Tuple[ContactData, ...]:
+        """Parse OCR text into contacts (memoized per instance by text)."""
         lines = [l.strip() for l in text.split("\n") if l.strip()]
-        return self._parse_card(lines)
+        raw_text = "\n".join(lines)
+        if len(text) > self.MAX_SCAN_CHARS:
+            logger.debug(f"Scanning first {self.MAX_SCAN_CHARS} of {len(text)} characters")
+            scan_text = text[:self.MAX_SCAN_CHARS]
+            lines = [l.strip() for l in scan_text.split("\n") if l.strip()]
+        return tuple(self._parse_card(lines, raw_text))
 
     # =========================
     # CORE PARSING
     # =========================
 
-    def _parse_card(self, lines: List[str]) -> List[ContactData]:
-        """Parse business card lines."""
+    def _parse_card(self, lines: List[str], raw_text: Optional[str] = None) -> List[ContactData]:
+        """Parse business card lines (raw_text defaults to the lines joined)."""
         
         # DEBUG: Log what we're parsing
         logger.debug(f"Parsing {len(lines)} lines")
         
         card_text = " ".join(lines)
+        
+        # Name, title and company are near the top of a card; the regex
+        # extractors below still see every line
+        head = lines[:self.MAX_SCAN_LINES]
+        
+        # Lowercase each line once for every extractor below
+        lower_lines = [line.lower() for line in head]
+        
+        # Name and company both skip contact-info lines - check each line once
+        personal_info = [
+            self._is_personal_info(line, lower) for line, lower in zip(head, lower_lines)
+        ]
+        
+        # Only run the contact extractors whose pattern occurs in the text
+        fired = self._matching_patterns(card_text)
 
         contact = ContactData(
-            name=self._extract_name(lines),
-            title=self._extract_title(lines),
-            company=self._extract_company(lines),
-            email=self._extract_email(card_text),
-            phone=self._extract_phone(card_text),
-            website=self._extract_website(card_text),
-            linkedin=self._extract_linkedin(card_text),
-            twitter=self._extract_twitter(card_text),
-            address=self._extract_address(card_text),
-            raw_text="\n".join(lines),
+            name=self._extract_name(head, personal_info, lower_lines),
+            title=self._extract_title(head, lower_lines),
+            company=self._extract_company(head, personal_info, lower_lines),
+            email=self._extract_email(card_text) if "email" in fired else "",
+            phone=self._extract_phone(card_text) if "phone" in fired else "",
+            website=self._extract_website(card_text) if "website" in fired else "",
+            linkedin=self._extract_linkedin(card_text) if "linkedin" in fired else "",
+            twitter=self._extract_twitter(card_text) if "twitter" in fired else "",
+            address=self._extract_address(card_text) if "zip" in fired else "",
+            raw_text="\n".join(lines) if raw_text is None else raw_text,
         )
         
         # DEBUG: Log what was extracted
@@ -119,194 +370,151 @@ class ContactParser:
     # HELPERS
     # =========================
 
-    def _is_personal_info(self, text: str) -> bool:
+    def _matching_patterns(self, text: str) -> frozenset:
+        """
+        Find which PATTERNS occur in the text with one multi-pattern scan.
+
+        Args:
+            text: Card text
+
+        Returns:
+            Names of the matching patterns; without RE2, the names of the
+            patterns whose required substrings occur (a superset)
+        """
+        if self._PATTERN_SET is None:
+            return frozenset(
+                name for name, required in self._PATTERN_REQUIRES.items()
+                if any(part in text for part in required)
+            )
+        matched = self._PATTERN_SET.Match(text) or ()
+        return frozenset(self._PATTERN_NAMES[i] for i in matched)
+
+    def _is_personal_info(self, text: str, lower: Optional[str] = None) -> bool:
+        if lower is None:
+            lower = text.lower()
         return (
             bool(self.patterns["email"].search(text))
             or bool(self.patterns["phone"].search(text))
-            or "http" in text.lower()
+            or "http" in lower
         )
 
-    def _extract_name(self, lines: List[str]) -> str:
+    def _extract_name(
+        self,
+        lines: List[str],
+        personal_info: Optional[List[bool]] = None,
+        lower_lines: Optional[List[str]] = None
+    ) -> str:
         """Extract person's name from business card using enhanced logic."""
+        if personal_info is None:
+            personal_info = [self._is_personal_info(line) for line in lines[:8]]
+        if lower_lines is None:
+            lower_lines = [line.strip().lower() for line in lines[:8]]
         
-        # Company keywords that indicate this is NOT a person's name
-        company_keywords = [
-            "solutions", "technologies", "technology", "systems", "group",
-            "corporation", "company", "corp", "inc", "llc", "ltd", "co",
-            "enterprises", "associates", "partners", "consulting", "services",
-            "international", "global", "worldwide", "industries", "holdings",
-            "capital", "investments", "financial", "bank", "credit", "insurance",
-            "real estate", "construction", "development", "manufacturing",
-            "communications", "telecommunications", "media", "marketing",
-            "consulting", "advisory", "management", "logistics", "transport",
-            "healthcare", "medical", "dental", "legal", "law", "firm",
-            "restaurant", "hotel", "retail", "store", "shop", "market",
-            "business card", "card", "test", "sample", "demo", "wave"
-        ]
-        
-        # Title keywords that might appear with names
-        title_keywords = [
-            "agent", "engineer", "developer", "manager", "director",
-            "consultant", "designer", "president", "founder", "chairman",
-            "captain", "officer", "ceo", "cto", "cfo", "vp", "vice president",
-            "specialist", "analyst", "coordinator", "supervisor", "lead",
-            "senior", "junior", "assistant", "associate", "principal", "chief"
-        ]
-        
-        # Common first names to help identify person names (expanded)
-        common_first_names = {
-            "james", "robert", "john", "michael", "david", "william", "richard",
-            "thomas", "christopher", "charles", "daniel", "matthew", "anthony",
-            "mark", "donald", "steven", "paul", "joshua", "kenneth", "kevin",
-            "brian", "george", "edward", "ronald", "timothy", "jason", "jeffrey",
-            "ryan", "jacob", "gary", "nicholas", "eric", "jonathan", "stephen",
-            "mary", "patricia", "jennifer", "linda", "elizabeth", "barbara",
-            "susan", "jessica", "sarah", "karen", "nancy", "lisa", "betty",
-            "helen", "sandra", "donna", "carol", "ruth", "sharon", "michelle",
-            "laura", "sarah", "kimberly", "deborah", "dorothy", "amy", "angela",
-            "brenda", "emma", "olivia", "cynthia", "marie", "janet", "catherine",
-            "frances", "christine", "samantha", "debra", "rachel", "carolyn",
-            "virginia", "heather", "diane", "julie", "joyce", "anna", "grace",
-            "alex", "alexander", "alexandra", "andrew", "andy", "ben", "benjamin",
-            "bill", "bob", "bobby", "chris", "christine", "christina", "dan",
-            "dave", "dennis", "frank", "fred", "greg", "gregory", "jack", 
-            "jake", "jim", "joe", "joseph", "kate", "katherine", "kelly",
-            "ken", "kevin", "kim", "kimberly", "larry", "laura", "linda",
-            "lisa", "margaret", "maria", "marie", "mark", "martin", "matt",
-            "matthew", "max", "mike", "nancy", "nick", "nicholas", "pat",
-            "patricia", "paul", "peter", "phil", "philip", "rick", "rob",
-            "robert", "sam", "samuel", "sara", "scott", "steve", "steven",
-            "susan", "tom", "thomas", "tim", "timothy", "tony", "william"
-        }
-        
-        potential_names = []
+        best_name = ""
+        best_score = 0.0
         
         for i, line in enumerate(lines[:8]):  # Check more lines
+            # No later line can outscore the current best (ties go to the
+            # earlier line), so the rest of the scan can be skipped
+            if best_score >= self._name_score("high", i):
+                break
+            
             line = line.strip()
             if not line:
                 continue
             
-            lower_line = line.lower()
+            lower_line = lower_lines[i]
             
             # Skip contact info
-            if self._is_personal_info(line):
+            if personal_info[i]:
                 continue
                 
-            # Skip lines that are obviously companies - be more aggressive
-            has_company_keyword = any(keyword in lower_line for keyword in company_keywords)
-            if has_company_keyword:
-                continue
-            
-            # Skip if line contains multiple company-like indicators
-            company_score = 0
-            if any(word in lower_line for word in ['inc', 'llc', 'ltd', 'corp', 'company']):
-                company_score += 3
-            if line.isupper() and len(line.split()) >= 3:
-                company_score += 2
-            if any(word in lower_line for word in ['solutions', 'services', 'systems', 'group']):
-                company_score += 2
-            
-            if company_score >= 3:
+            # Skip lines with too many numbers (addresses, phones) - a
+            # C-level translate, so it runs before the keyword scan
+            if len(line) - len(line.translate(_DELETE_DIGITS)) > 4:
                 continue
             
-            # Skip lines with too many numbers (addresses, phones)
-            if sum(c.isdigit() for c in line) > 4:
+            # Skip lines that are obviously companies - be more aggressive.
+            # The keywords include every company suffix and sector word, so
+            # a line that passes cannot score as a company on those either
+            if self._name_company_matcher.search(lower_line):
                 continue
             
             # Extract potential names from lines with titles
-            if any(t in lower_line for t in title_keywords):
+            candidate = None
+            title = self._name_title_matcher.first(lower_line)
+            if title:
                 # Find the part before the title
-                for title in title_keywords:
-                    if title in lower_line:
-                        title_pos = lower_line.find(title)
-                        before_title = line[:title_pos].strip().rstrip(',').strip()
-                        if before_title:
-                            words = before_title.split()
-                            # Check if it looks like a person's name
-                            if 2 <= len(words) <= 4 and all(w[0].isupper() for w in words if w.isalpha()):
-                                potential_names.append((before_title, i, 'with_title'))
-                        break
-                continue
+                title_pos = lower_line.find(title)
+                before_title = line[:title_pos].strip().rstrip(',').strip()
+                if before_title:
+                    words = before_title.split()
+                    # Check if it looks like a person's name
+                    if 2 <= len(words) <= 4 and all(w[0].isupper() for w in words if w.isalpha()):
+                        candidate = (before_title, 'with_title')
+            else:
+                # Look for lines that look like person names (2-4 capitalized words)
+                words = [w for w in line.split() if w.translate(_DELETE_NAME_PUNCTUATION).isalpha()]
+                if 2 <= len(words) <= 4 and all(w[0].isupper() for w in words):
+                    # Check if first word is a common first name
+                    first_word = words[0].lower().translate(_DELETE_NAME_PUNCTUATION)
+                    
+                    # High priority for common first names
+                    if first_word in self.COMMON_FIRST_NAMES:
+                        candidate = (line, 'high')
+                    # Medium priority for proper name patterns (company lines were skipped above)
+                    elif len(words) == 2:
+                        candidate = (line, 'medium')
+                    # Lower priority for 3-4 word names (could be companies)
+                    elif 3 <= len(words) <= 4 and first_word in self.COMMON_FIRST_NAMES:
+                        candidate = (line, 'medium')
             
-            # Look for lines that look like person names (2-4 capitalized words)
-            words = [w for w in line.split() if w.replace(',', '').replace('.', '').isalpha()]
-            if 2 <= len(words) <= 4 and all(w[0].isupper() for w in words):
-                # Check if first word is a common first name
-                first_word = words[0].lower().replace(',', '').replace('.', '')
-                
-                # High priority for common first names
-                if first_word in common_first_names:
-                    potential_names.append((line.strip(), i, 'high'))
-                # Medium priority for proper name patterns without company keywords
-                elif len(words) == 2 and not has_company_keyword:
-                    potential_names.append((line.strip(), i, 'medium'))
-                # Lower priority for 3-4 word names (could be companies)
-                elif 3 <= len(words) <= 4 and first_word in common_first_names:
-                    potential_names.append((line.strip(), i, 'medium'))
-        
-        # Sort potential names by priority and position
-        def name_priority(item):
-            name, position, priority = item
-            priority_score = {'high': 10, 'with_title': 8, 'medium': 5}.get(priority, 0)
-            # Earlier lines get preference
-            position_score = max(0, 8 - position) * 0.5
-            return priority_score + position_score
+            if candidate:
+                name, priority = candidate
+                score = self._name_score(priority, i)
+                if score > best_score:
+                    best_name, best_score = name, score
         
-        if potential_names:
-            potential_names.sort(key=name_priority, reverse=True)
-            return potential_names[0][0]
-        
-        return ""
-
-    def _extract_title(self, lines: List[str]) -> str:
+        return best_name
+
+    @classmethod
+    def _name_score(cls, priority: str, position: int) -> float:
+        """Score a name candidate by priority and line position."""
+        priority_score = cls.NAME_PRIORITY_SCORES.get(priority, 0)
+        # Earlier lines get preference
+        position_score = max(0, 8 - position) * 0.5
+        return priority_score + position_score
+
+    @classmethod
+    def _company_score(cls, candidate: Tuple[str, int, str]) -> float:
+        """Score a (line, position, priority) company candidate."""
+        _, position, priority_type = candidate
+        priority_score = cls.COMPANY_PRIORITY_SCORES.get(priority_type, 0)
+        # Earlier lines get slight preference (but not as much as priority)
+        position_score = max(0, 10 - position) * 0.1
+        return priority_score + position_score
+
+    def _extract_title(self, lines: List[str], lower_lines: Optional[List[str]] = None) -> str:
         """Extract job title."""
-        title_keywords = [
-            "real estate agent", "agent", "engineer", "developer",
-            "manager", "director", "captain", "founder", "chairman",
-            "consultant", "designer", "president", "ceo", "cto", "cfo",
-            "vice president", "vp", "officer", "specialist", "analyst"
-        ]
-
-        for line in lines:
-            lower = line.lower()
-            if any(t in lower for t in title_keywords):
+        if lower_lines is None:
+            lower_lines = [line.lower() for line in lines]
+        for line, lower in zip(lines, lower_lines):
+            if self._title_matcher.search(lower):
                 return line
 
         return ""
 
-    def _extract_company(self, lines: List[str]) -> str:
+    def _extract_company(
+        self,
+        lines: List[str],
+        personal_info: Optional[List[bool]] = None,
+        lower_lines: Optional[List[str]] = None
+    ) -> str:
         """Extract company name with enhanced logic."""
-        # Strong company indicators (must match exactly or as word)
-        strong_indicators = [
-            "inc", "llc", "ltd", "corp", "corporation", "company", "co",
-            "technologies", "systems", "group", "solutions", "associates",
-            "partners", "enterprises", "consulting", "services", "holdings",
-            "international", "global", "industries", "manufacturing",
-            "communications", "media", "healthcare", "financial", "capital",
-            "investments", "management", "logistics", "development"
-        ]
-        
-        # Weak indicators (context-dependent)
-        weak_indicators = [
-            "tech", "software", "design", "creative", "digital", "studio",
-            "center", "clinic", "hospital", "medical", "legal", "law",
-            "restaurant", "hotel", "retail", "construction", "engineering",
-            "marketing", "communications", "real estate", "automotive",
-            "insurance", "bank", "credit"
-        ]
-        
-        # Skip patterns (never company names)
-        skip_patterns = [
-            "business card", "calling card", "test", "sample", "demo",
-            "card", "front", "back", "side"
-        ]
-        
-        # Name-like patterns to avoid
-        name_patterns = [
-            r'^[A-Z][a-z]+ [A-Z][a-z]+$',  # First Last
-            r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+$',  # First M. Last
-            r'^[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+$'  # First Middle Last
-        ]
+        if personal_info is None:
+            personal_info = [self._is_personal_info(line) for line in lines]
+        if lower_lines is None:
+            lower_lines = [line.strip().lower() for line in lines]
         
         potential_companies = []
         
@@ -315,35 +523,36 @@ class ContactParser:
             if not line:
                 continue
                 
-            lower_line = line.lower()
+            lower_line = lower_lines[i]
             
             # Skip contact info and personal info
-            if self._is_personal_info(line):
+            if personal_info[i]:
                 continue
             
+            hits = self._company_line_matcher.search(lower_line)
+            
             # Skip obvious non-company patterns
-            if any(skip in lower_line for skip in skip_patterns):
+            if "skip" in hits:
                 continue
                 
+            # Split once; lowercasing never adds or removes whitespace, so
+            # this also gives the word count of the original line
+            lower_words = lower_line.split()
+            
+            # Strong indicator as a whole word (singular or plural)
+            has_strong_word = not self._STRONG_INDICATOR_WORDS.isdisjoint(lower_words)
+            
             # Skip if it looks like a person's name
-            is_name_like = any(re.match(pattern, line) for pattern in name_patterns)
+            is_name_like = self.NAME_LIKE_PATTERN.match(line) is not None
             if is_name_like:
                 # Double-check: if it has strong company indicators, keep it
-                has_strong_indicator = any(
-                    indicator in lower_line.split() or 
-                    indicator + 's' in lower_line.split()
-                    for indicator in strong_indicators
-                )
-                if not has_strong_indicator:
+                if not has_strong_word:
                     continue
             
             # Check for strong indicators (high priority)
-            has_strong = any(
-                indicator in lower_line.split() or 
-                indicator + 's' in lower_line.split() or
-                ('.' + indicator in lower_line) or
-                (indicator + '.' in lower_line)
-                for indicator in strong_indicators
+            has_strong = (
+                has_strong_word
+                or "strong_dot" in hits
             )
             
             if has_strong:
@@ -351,43 +560,26 @@ class ContactParser:
                 continue
             
             # Check for weak indicators (medium priority)
-            has_weak = any(indicator in lower_line for indicator in weak_indicators)
-            if has_weak:
+            if "weak" in hits:
                 potential_companies.append((line, i, 'weak'))
                 continue
             
             # Check for all-caps (often company names) - but be careful
             if line.isupper() and len(line) > 5 and not is_name_like:
                 # Make sure it's not just a person's name in caps
-                words = line.split()
-                if len(words) >= 2:  # Multi-word all-caps = likely company
+                if len(lower_words) >= 2:  # Multi-word all-caps = likely company
                     potential_companies.append((line, i, 'caps'))
                     continue
             
             # Check for multi-word non-name patterns
-            words = line.split()
-            if len(words) >= 3:  # 3+ words are often companies
+            if len(lower_words) >= 3:  # 3+ words are often companies
                 # But exclude obvious name patterns
                 if not is_name_like:
                     potential_companies.append((line, i, 'multi_word'))
         
-        # Sort by priority and position
-        def company_priority(item):
-            company, position, priority_type = item
-            priority_scores = {
-                'strong': 10,
-                'caps': 5,
-                'weak': 3,
-                'multi_word': 2
-            }
-            priority_score = priority_scores.get(priority_type, 0)
-            # Earlier lines get slight preference (but not as much as priority)
-            position_score = max(0, 10 - position) * 0.1
-            return priority_score + position_score
-        
         if potential_companies:
-            potential_companies.sort(key=company_priority, reverse=True)
-            return potential_companies[0][0]
+            # Highest score wins; ties go to the earliest candidate
+            return max(potential_companies, key=self._company_score)[0]
         
         return ""
 
@@ -401,9 +593,10 @@ class ContactParser:
         m = self.patterns["phone"].search(text)
         if m:
             phone = m.group(0)
-            # Validate: must have at least 10 digits
-            digits = ''.join(c for c in phone if c.isdigit())
-            if 10 <= len(digits) <= 15:
+            # Validate: must have at least 10 digits (the pattern only
+            # matches ASCII digits, so the deleted length is the digit count)
+            digit_count = len(phone) - len(phone.translate(_DELETE_DIGITS))
+            if 10 <= digit_count <= 15:
                 return phone
         return ""
 
@@ -412,10 +605,8 @@ class ContactParser:
         m = self.patterns["website"].search(text)
         if m:
             url = m.group(0)
-            # Ensure it has protocol
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-            return url
+            # Ensure it has protocol (group 1 is the scheme, if the text had one)
+            return url if m.group(1) else f"https://{url}"
         return ""
 
     def _extract_linkedin(self, text: str) -> str:
@@ -448,4 +639,23 @@ class ContactParser:
         if c.phone: score += 1
         if c.address: score += 1
 
-        return score / total
\ No newline at end of file
+        return score / total
+
+
+# =========================
+# BATCH WORKERS
+# =========================
+
+# Parser owned by the current parse_batch worker process
+_WORKER_PARSER: Optional[ContactParser] = None
+
+
+def _init_parse_worker(parser_class: type) -> None:
+    """Build the worker's parser once, at process start."""
+    global _WORKER_PARSER
+    _WORKER_PARSER = parser_class()
+
+
+def _parse_in_worker(text: str, ocr_confidence: float) -> ContactData:
+    """Parse one text with the worker's parser."""
+    return _WORKER_PARSER.parse(text, ocr_confidence)
@@ -9,19 +9,25 @@ HYBRID APPROACH:
 
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from .ocr import OCRExtractor
-from .parser import ContactParser
-from .researcher import ContactResearcher
+from .parser import ContactData, ContactParser
+from .researcher import ContactResearcher, build_http_session
 from .vlm_ocr import GeminiOCR, is_gemini_configured
 from .enrichment import CompanyEnricher, FieldConfidenceScorer
 from src.postprocessing import postprocess_contact
 
 logger = logging.getLogger(__name__)
 
+# str.translate table that deletes ASCII digits (one C-level pass per string)
+_DELETE_DIGITS = str.maketrans("", "", "0123456789")
+
 # Confidence threshold for Gemini fallback
 GEMINI_FALLBACK_THRESHOLD = 0.70  # Use Gemini if EasyOCR confidence < 70%
 MIN_REQUIRED_FIELDS = 3  # Minimum fields required (name, email, phone, company, title)
@@ -40,12 +46,23 @@ class CardResearchPipeline:
         output_folder: str = "./outputs",
         ocr_languages: List[str] = None,
         ocr_gpu: bool = False,
+        ocr_pool_workers: int = 0,
+        ocr_cache_path: Optional[str] = None,
+        ocr_canvas_size: int = 2560,
+        ocr_compile_models: bool = False,
+        ocr_precision: str = "fp32",
+        ocr_fast_path_min_lines: int = 0,
+        ocr_fast_path_min_confidence: float = 0.6,
+        ocr_batch_size: int = 16,
+        batch_workers: int = 1,
+        ocr_concurrency: int = 0,
         hunter_api_key: Optional[str] = None,
         abstract_api_key: Optional[str] = None,
         github_token: Optional[str] = None,
         gemini_api_key: Optional[str] = None,
         use_gemini_fallback: bool = True,
-        gemini_model: str = "gemini-2.5-flash"
+        gemini_model: str = "gemini-2.5-flash",
+        gemini_max_concurrency: int = 2
     ):
         self.output_folder = Path(output_folder)
         self.output_folder.mkdir(parents=True, exist_ok=True)
@@ -53,44 +70,88 @@ class CardResearchPipeline:
         # Primary OCR: EasyOCR (FREE)
         self.ocr = OCRExtractor(
             languages=ocr_languages or ["en"],
-            gpu=ocr_gpu
+            gpu=ocr_gpu,
+            pool_workers=ocr_pool_workers,
+            cache_path=ocr_cache_path,
+            canvas_size=ocr_canvas_size,
+            compile_models=ocr_compile_models,
+            precision=ocr_precision,
+            fast_path_min_lines=ocr_fast_path_min_lines,
+            fast_path_min_confidence=ocr_fast_path_min_confidence
         )
 
+        # Images per readtext_batched call when a GPU batch is read up front
+        self.ocr_batch_size = max(1, ocr_batch_size)
+
         self.parser = ContactParser()
 
+        # Images process_batch works on at once; OCR inference releases the
+        # GIL and enrichment/Gemini wait on the network, so threads overlap
+        self.batch_workers = max(1, batch_workers)
+
+        # Optional cap on workers inside EasyOCR at once, so a batch can run
+        # many network-bound workers without oversubscribing the OCR model
+        self._ocr_slots = threading.BoundedSemaphore(ocr_concurrency) if ocr_concurrency > 0 else None
+
+        # One keep-alive session for every enrichment API call
+        self.http_session = build_http_session()
+
         self.researcher = ContactResearcher(
             hunter_api_key=hunter_api_key,
             abstract_api_key=abstract_api_key,
-            github_token=github_token
+            github_token=github_token,
+            session=self.http_session
         )
         
         # Company enricher (cached - initialized once)
-        self.company_enricher = CompanyEnricher()
+        self.company_enricher = CompanyEnricher(session=self.http_session)
         
         # Field confidence scorer base (reused)
         self.confidence_scorer_class = FieldConfidenceScorer
 
-        # Fallback OCR: Gemini (nearly free, high accuracy)
+        # Fallback OCR: Gemini (nearly free, high accuracy); the client is
+        # built on first use so cards EasyOCR handles never pay for it
         self.use_gemini_fallback = use_gemini_fallback
-        self.gemini_ocr = None
-        
-        if use_gemini_fallback:
-            api_key = gemini_api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
-            if api_key:
-                try:
-                    self.gemini_ocr = GeminiOCR(api_key=api_key, model=gemini_model)
-                    if self.gemini_ocr.is_available():
-                        logger.info(f"Gemini fallback enabled with model: {gemini_model}")
-                    else:
-                        self.gemini_ocr = None
-                        logger.warning("Gemini fallback not available")
-                except Exception as e:
-                    logger.warning(f"Failed to initialize Gemini: {e}")
-            else:
-                logger.info("Gemini API key not configured. Using EasyOCR only.")
+        self.gemini_api_key = gemini_api_key
+        self.gemini_model = gemini_model
+        self.gemini_max_concurrency = gemini_max_concurrency
+        self._gemini_ocr = None
+        self._gemini_ready = not use_gemini_fallback
+        self._gemini_lock = threading.Lock()
 
         logger.info("CardResearchPipeline initialized")
 
+    @property
+    def gemini_ocr(self) -> Optional[GeminiOCR]:
+        """Gemini fallback client, built on first use (None if unavailable)."""
+        if not self._gemini_ready:
+            with self._gemini_lock:
+                if not self._gemini_ready:
+                    self._gemini_ocr = self._init_gemini()
+                    self._gemini_ready = True
+        return self._gemini_ocr
+
+    def _init_gemini(self) -> Optional[GeminiOCR]:
+        """Create the Gemini client, or None if it is not configured or fails."""
+        api_key = self.gemini_api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            logger.info("Gemini API key not configured. Using EasyOCR only.")
+            return None
+
+        try:
+            gemini_ocr = GeminiOCR(
+                api_key=api_key,
+                model=self.gemini_model,
+                max_concurrency=self.gemini_max_concurrency
+            )
+            if gemini_ocr.is_available():
+                logger.info(f"Gemini fallback enabled with model: {self.gemini_model}")
+                return gemini_ocr
+            logger.warning("Gemini fallback not available")
+        except Exception as e:
+            logger.warning(f"Failed to initialize Gemini: {e}")
+        return None
+
     # ======================================================
     # SINGLE IMAGE
     # ======================================================
@@ -99,7 +160,7 @@ class CardResearchPipeline:
         """Check if extracted data has obvious OCR errors (numbers in names, etc.)."""
         # Check if name contains numbers (like "Wi11iam" that wasn't corrected)
         name = contact_dict.get("name", "") or ""
-        if name and any(c.isdigit() for c in name):
+        if name and name.translate(_DELETE_DIGITS) != name:
             logger.info(f"Name contains numbers: {name} - likely OCR error")
             return True
         
@@ -107,14 +168,15 @@ class CardResearchPipeline:
         company = contact_dict.get("company", "") or ""
         if company:
             # Count digits in company name
-            digit_count = sum(1 for c in company if c.isdigit())
+            digit_count = len(company) - len(company.translate(_DELETE_DIGITS))
             if digit_count > 2 and digit_count / len(company) > 0.1:
                 logger.info(f"Company has too many numbers: {company} - likely OCR error")
                 return True
         
         # Check if email has obvious errors
         email = contact_dict.get("email", "") or ""
-        if email and ("1" in email.split("@")[0] or "0" in email.split("@")[0]):
+        local_part = email.partition("@")[0]
+        if email and ("1" in local_part or "0" in local_part):
             # Suspicious numbers in email username
             logger.info(f"Email may have OCR errors: {email}")
             return True
@@ -123,28 +185,46 @@ class CardResearchPipeline:
 
     def _should_use_gemini_fallback(self, ocr_confidence: float, contact_dict: Dict) -> bool:
         """Determine if we should fallback to Gemini for better accuracy."""
-        if not self.gemini_ocr or not self.gemini_ocr.is_available():
+        if not self.use_gemini_fallback:
             return False
         
+        # Decide from the EasyOCR result first; the Gemini client is only
+        # built once a card actually needs it
+        reason = None
+        
         # Check confidence threshold
         if ocr_confidence < GEMINI_FALLBACK_THRESHOLD:
-            logger.info(f"Low confidence ({ocr_confidence:.2%}) - using Gemini fallback")
-            return True
-        
-        # Check if key fields are missing
-        key_fields = ["name", "email", "phone", "company"]
-        found_fields = sum(1 for f in key_fields if contact_dict.get(f))
-        
-        if found_fields < MIN_REQUIRED_FIELDS:
-            logger.info(f"Missing key fields ({found_fields}/{MIN_REQUIRED_FIELDS}) - using Gemini fallback")
-            return True
+            reason = f"Low confidence ({ocr_confidence:.2%})"
+        else:
+            # Check if key fields are missing
+            key_fields = ["name", "email", "phone", "company"]
+            found_fields = sum(1 for f in key_fields if contact_dict.get(f))
+            
+            if found_fields < MIN_REQUIRED_FIELDS:
+                reason = f"Missing key fields ({found_fields}/{MIN_REQUIRED_FIELDS})"
+            # Check for obvious OCR errors in the extracted data
+            elif self._has_ocr_errors(contact_dict):
+                reason = "OCR errors detected in extracted data"
         
-        # Check for obvious OCR errors in the extracted data
-        if self._has_ocr_errors(contact_dict):
-            logger.info("OCR errors detected in extracted data - using Gemini fallback")
-            return True
+        # gemini_ocr is only set once the client is configured and available
+        if reason is None or not self.gemini_ocr:
+            return False
         
-        return False
+        logger.info(f"{reason} - using Gemini fallback")
+        return True
+
+    def _extract_text(self, image_path: Path) -> Dict:
+        """Run EasyOCR on an image, waiting for a slot if OCR concurrency is capped."""
+        if self._ocr_slots is None:
+            return self.ocr.extract_text(image_path)
+        with self._ocr_slots:
+            return self.ocr.extract_text(image_path)
+
+    @staticmethod
+    def _split_name(name: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Split a full name into (first name, rest of the name)."""
+        words = (name or "").split()
+        return (words[0] if words else None), " ".join(words[1:]) or None
 
     def _process_with_gemini(self, image_path: Path) -> Optional[Dict]:
         """Process image using Gemini VLM."""
@@ -155,10 +235,11 @@ class CardResearchPipeline:
             result = self.gemini_ocr.extract(image_path)
             
             if result.success:
+                first_name, last_name = self._split_name(result.name)
                 return {
                     "name": result.name,
-                    "first_name": result.name.split()[0] if result.name else None,
-                    "last_name": " ".join(result.name.split()[1:]) if result.name and len(result.name.split()) > 1 else None,
+                    "first_name": first_name,
+                    "last_name": last_name,
                     "title": result.title,
                     "company": result.company,
                     "email": result.email,
@@ -175,7 +256,20 @@ class CardResearchPipeline:
         
         return None
 
-    def process_image(self, image_path: Path, enrich: bool = True, force_gemini: bool = False) -> Dict:
+    def _timed_gemini_fallback(self, image_path: Path) -> Optional[Dict]:
+        """Run the Gemini fallback on an image, logging how long it took."""
+        gemini_start = time.perf_counter()
+        gemini_result = self._process_with_gemini(image_path)
+        logger.debug(f"⏱️ Gemini fallback: {time.perf_counter() - gemini_start:.2f}s")
+        return gemini_result
+
+    def process_image(
+        self,
+        image_path: Path,
+        enrich: bool = True,
+        force_gemini: bool = False,
+        ocr_result: Optional[Dict] = None
+    ) -> Dict:
         """
         Process a business card image.
         
@@ -183,9 +277,9 @@ class CardResearchPipeline:
             image_path: Path to the image
             enrich: Whether to enrich with external APIs
             force_gemini: Force using Gemini (skip EasyOCR)
+            ocr_result: EasyOCR result already extracted for this image
         """
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"Processing image: {image_path}")
@@ -203,35 +297,44 @@ class CardResearchPipeline:
             # Option 2: Standard flow - EasyOCR first, Gemini fallback
             if not final_contact:
                 # 1️⃣ PRIMARY OCR: EasyOCR (FREE)
-                ocr_start = time.time()
-                ocr_result = self.ocr.extract_text(image_path)
+                ocr_start = time.perf_counter()
+                if ocr_result is None:
+                    ocr_result = self._extract_text(image_path)
                 raw_text = ocr_result.get("raw_text", "")
                 ocr_confidence = ocr_result.get("confidence", 0.0)
-                logger.debug(f"⏱️ EasyOCR: {time.time() - ocr_start:.2f}s")
+                logger.debug(f"⏱️ EasyOCR: {time.perf_counter() - ocr_start:.2f}s")
 
-                # 2️⃣ PARSE
-                parse_start = time.time()
-                parsed_contacts = []
-                if ocr_result.get("success") and raw_text:
-                    parsed_contacts = self.parser.parse_from_image_text(raw_text)
-                logger.debug(f"⏱️ Parse: {time.time() - parse_start:.2f}s")
+                # Low confidence always falls back, so try Gemini before
+                # spending a parse and post-process it would throw away
+                gemini_first = (
+                    ocr_confidence < GEMINI_FALLBACK_THRESHOLD
+                    and self._should_use_gemini_fallback(ocr_confidence, {})
+                )
+                gemini_result = self._timed_gemini_fallback(image_path) if gemini_first else None
 
-                # 3️⃣ POST-PROCESS
+                parsed_contacts = []
                 cleaned_contact = {}
-                if parsed_contacts:
-                    raw_contact_dict = parsed_contacts[0].to_dict()
-                    cleaned_contact = postprocess_contact(raw_contact_dict)
-
-                # 4️⃣ CHECK IF GEMINI FALLBACK NEEDED
-                if self._should_use_gemini_fallback(ocr_confidence, cleaned_contact):
-                    gemini_start = time.time()
-                    gemini_result = self._process_with_gemini(image_path)
-                    logger.debug(f"⏱️ Gemini fallback: {time.time() - gemini_start:.2f}s")
-                    if gemini_result:
-                        final_contact = gemini_result
-                        ocr_method = "gemini_fallback"
-                        ocr_confidence = gemini_result.get("confidence_score", 0.9)
-                        raw_text = gemini_result.get("raw_text", raw_text)
+                if not gemini_result:
+                    # 2️⃣ PARSE
+                    parse_start = time.perf_counter()
+                    if ocr_result.get("success") and raw_text:
+                        parsed_contacts = self.parser.parse_from_image_text(raw_text)
+                    logger.debug(f"⏱️ Parse: {time.perf_counter() - parse_start:.2f}s")
+
+                    # 3️⃣ POST-PROCESS
+                    if parsed_contacts:
+                        raw_contact_dict = parsed_contacts[0].to_dict()
+                        cleaned_contact = postprocess_contact(raw_contact_dict)
+
+                    # 4️⃣ CHECK IF GEMINI FALLBACK NEEDED
+                    if not gemini_first and self._should_use_gemini_fallback(ocr_confidence, cleaned_contact):
+                        gemini_result = self._timed_gemini_fallback(image_path)
+
+                if gemini_result:
+                    final_contact = gemini_result
+                    ocr_method = "gemini_fallback"
+                    ocr_confidence = gemini_result.get("confidence_score", 0.9)
+                    raw_text = gemini_result.get("raw_text", raw_text)
 
                 # 5️⃣ USE EASYOCR RESULT IF NO GEMINI
                 if not final_contact:
@@ -244,10 +347,11 @@ class CardResearchPipeline:
                             "image": str(image_path)
                         }
 
+                    first_name, last_name = self._split_name(cleaned_contact.get("name"))
                     final_contact = {
                         "name": cleaned_contact.get("name"),
-                        "first_name": cleaned_contact.get("name").split()[0] if cleaned_contact.get("name") else None,
-                        "last_name": " ".join(cleaned_contact.get("name").split()[1:]) if cleaned_contact.get("name") and len(cleaned_contact.get("name").split()) > 1 else None,
+                        "first_name": first_name,
+                        "last_name": last_name,
                         "title": cleaned_contact.get("title"),
                         "company": cleaned_contact.get("company"),
                         "email": cleaned_contact.get("email"),
@@ -263,7 +367,6 @@ class CardResearchPipeline:
             
             if enrich and final_contact and (final_contact.get("email") or final_contact.get("name")):
                 try:
-                    from .parser import ContactData
                     contact_obj = ContactData(
                         name=final_contact.get("name"),
                         email=final_contact.get("email"),
@@ -309,7 +412,7 @@ class CardResearchPipeline:
                 except Exception as e:
                     logger.warning(f"Confidence scoring failed: {e}")
 
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             logger.info(f"⏱️ Total processing time: {total_time:.2f}s ({ocr_method})")
             
             return {
@@ -347,15 +450,21 @@ class CardResearchPipeline:
             enrich: Whether to enrich with external APIs
             force_gemini: Force using Gemini for all images
         """
-        results = []
-        success_count = 0
+        def process(path: Path, ocr_result: Optional[Dict] = None) -> Dict:
+            return self.process_image(
+                path, enrich=enrich, force_gemini=force_gemini, ocr_result=ocr_result
+            )
 
-        for path in image_paths:
-            result = self.process_image(path, enrich=enrich, force_gemini=force_gemini)
-            results.append(result)
+        ocr_results = self._batch_ocr(image_paths, force_gemini)
 
-            if result.get("success"):
-                success_count += 1
+        if self.batch_workers > 1 and len(image_paths) > 1:
+            workers = min(self.batch_workers, len(image_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(process, image_paths, ocr_results))
+        else:
+            results = [process(path, ocr) for path, ocr in zip(image_paths, ocr_results)]
+
+        success_count = sum(1 for result in results if result.get("success"))
 
         return {
             "success": True,
@@ -365,6 +474,60 @@ class CardResearchPipeline:
             "results": results
         }
 
+    def process_batch_iter(
+        self,
+        image_paths: List[Path],
+        enrich: bool = True,
+        force_gemini: bool = False
+    ) -> Iterator[Dict]:
+        """Process multiple business card images, yielding results as they finish.
+        
+        Results come in completion order (each carries its "image" path), so
+        a caller can stream them out without holding the whole batch.
+        
+        Args:
+            image_paths: List of image paths
+            enrich: Whether to enrich with external APIs
+            force_gemini: Force using Gemini for all images
+        """
+        ocr_results = self._batch_ocr(image_paths, force_gemini)
+
+        if self.batch_workers <= 1 or len(image_paths) <= 1:
+            for path, ocr_result in zip(image_paths, ocr_results):
+                yield self.process_image(
+                    path, enrich=enrich, force_gemini=force_gemini, ocr_result=ocr_result
+                )
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(self.batch_workers, len(image_paths)))
+        try:
+            futures = [
+                executor.submit(self.process_image, path, enrich, force_gemini, ocr_result)
+                for path, ocr_result in zip(image_paths, ocr_results)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # A caller that stops early (client gone) drops the queued cards
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _batch_ocr(self, image_paths: List[Path], force_gemini: bool) -> Iterable[Optional[Dict]]:
+        """Get EasyOCR results for a batch, in input order (None = OCR in process_image).
+        
+        On GPU the whole batch is read up front in size buckets. A serial
+        batch streams its OCR, so the next images are decoded and
+        preprocessed while the current card is parsed and enriched. Parallel
+        workers already overlap those stages across cards and OCR their
+        own images.
+        """
+        if force_gemini or len(image_paths) <= 1:
+            return [None] * len(image_paths)
+        if self.ocr.gpu:
+            return self.ocr.extract_text_batch(image_paths, max_batch_size=self.ocr_batch_size)
+        if self.batch_workers == 1:
+            return (result for _, result in self.ocr.extract_text_stream(image_paths))
+        return [None] * len(image_paths)
+
     # ======================================================
     # STATUS
     # ======================================================
@@ -373,7 +536,7 @@ class CardResearchPipeline:
         """Get pipeline status information."""
         return {
             "ocr_engine": "easyocr",
-            "gemini_fallback_enabled": self.gemini_ocr is not None and self.gemini_ocr.is_available(),
+            "gemini_fallback_enabled": self.gemini_ocr is not None,
             "gemini_model": self.gemini_ocr.model_name if self.gemini_ocr else None,
             "ocr_languages": self.ocr.languages,
             "output_folder": str(self.output_folder)
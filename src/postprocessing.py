@@ -7,6 +7,19 @@ import re
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from ._keywords import KeywordMatcher
+
+# str.translate table that deletes ASCII digits (one C-level pass per string)
+_DELETE_DIGITS = str.maketrans("", "", "0123456789")
+
+# str.translate table that deletes the ASCII characters PHONE_NOISE_REGEX
+# strips, i.e. everything but digits, whitespace and + - ( )
+_DELETE_PHONE_NOISE = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128))
+    if not (c.isdigit() or c.isspace() or c in "+-()")
+))
+
+
 @dataclass
 class StructuredContact:
     """Structured contact data after post-processing."""
@@ -54,10 +67,36 @@ class ContactPostProcessor:
         r'\b\d{5}(?:-\d{4})?\b'  # ZIP codes
     ]
     
-    def __init__(self):
-        # Compile regex patterns
-        self.title_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.TITLE_PATTERNS]
-        self.address_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.ADDRESS_PATTERNS]
+    # Contact details to strip out of company names
+    COMPANY_NOISE_PATTERNS = [
+        r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',  # Email
+        r'(\+?\d{1,3}[\s\-]?)?(\(?\d{3}\)?[\s\-]?)?\d{3}[\s\-]?\d{4}',  # Phone
+        r'(https?://)?(www\.)?[a-zA-Z0-9\-]+\.[a-zA-Z]{2,}'  # URL
+    ]
+    
+    # Lowercase indicators for spotting a company line in raw text
+    _line_company_matcher = KeywordMatcher([
+        'inc', 'llc', 'ltd', 'corp', 'corporation', 'company', 'co',
+        'group', 'technologies', 'technology', 'solutions', 'systems',
+        'associates', 'partners', 'enterprises', 'consulting'
+    ])
+    
+    # Lowercase words at least one of which every TITLE_PATTERNS match contains
+    _name_title_matcher = KeywordMatcher([
+        'senior', 'junior', 'lead', 'chief', 'head', 'principal',
+        'manager', 'director', 'engineer', 'developer', 'designer', 'analyst',
+        'specialist', 'consultant', 'ceo', 'cto', 'cfo', 'coo', 'vp',
+        'president', 'founder', 'partner', 'real estate agent',
+        'sales representative'
+    ])
+    
+    # Characters stripped from phone numbers
+    PHONE_NOISE_REGEX = re.compile(r'[^\d\+\-\(\)\s]')
+    
+    # Compiled patterns, built once at import and shared by every instance
+    title_regex = tuple(re.compile(pattern, re.IGNORECASE) for pattern in TITLE_PATTERNS)
+    address_regex = tuple(re.compile(pattern, re.IGNORECASE) for pattern in ADDRESS_PATTERNS)
+    company_noise_regex = tuple(re.compile(pattern) for pattern in COMPANY_NOISE_PATTERNS)
     
     def process(self, raw_contact: Dict) -> StructuredContact:
         """
@@ -118,22 +157,16 @@ class ContactPostProcessor:
     
     def _extract_company_from_lines(self, lines: List[str]) -> Optional[str]:
         """Extract company name from text lines."""
-        company_indicators = [
-            'inc', 'llc', 'ltd', 'corp', 'corporation', 'company', 'co',
-            'group', 'technologies', 'technology', 'solutions', 'systems',
-            'associates', 'partners', 'enterprises', 'consulting'
-        ]
-        
         for line in lines:
             lower = line.lower()
             # Skip lines with email/phone/website
             if '@' in line or 'www' in lower or 'http' in lower:
                 continue
             # Skip lines that are mostly numbers (phone/address)
-            if sum(c.isdigit() for c in line) > len(line) * 0.3:
+            if len(line) - len(line.translate(_DELETE_DIGITS)) > len(line) * 0.3:
                 continue
             # Check for company indicators
-            if any(ind in lower for ind in company_indicators):
+            if self._line_company_matcher.search(lower):
                 return line.strip()
         
         # Fallback: look for all-caps lines (often company names)
@@ -147,29 +180,34 @@ class ContactPostProcessor:
         """Clean and validate extracted data."""
         
         # Clean name
-        if contact.name:
-            # Remove titles from name
-            for pattern in self.TITLE_PATTERNS:
-                if re.search(pattern, contact.name, re.IGNORECASE):
-                    contact.name = re.sub(pattern, '', contact.name, flags=re.IGNORECASE).strip()
+        # (non-ASCII names skip the keyword prescan, since IGNORECASE
+        # folds some characters that str.lower() leaves alone)
+        if contact.name and (
+            not contact.name.isascii()
+            or self._name_title_matcher.search(contact.name.lower())
+        ):
+            # Remove titles from name (one scan per pattern; strip only on a hit)
+            for pattern in self.title_regex:
+                name, count = pattern.subn('', contact.name)
+                if count:
+                    contact.name = name.strip()
         
         # Clean company
         if contact.company:
             # Remove email/phone/website from company
-            email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-            phone_pattern = r'(\+?\d{1,3}[\s\-]?)?(\(?\d{3}\)?[\s\-]?)?\d{3}[\s\-]?\d{4}'
-            url_pattern = r'(https?://)?(www\.)?[a-zA-Z0-9\-]+\.[a-zA-Z]{2,}'
-            
-            contact.company = re.sub(email_pattern, '', contact.company)
-            contact.company = re.sub(phone_pattern, '', contact.company)
-            contact.company = re.sub(url_pattern, '', contact.company)
+            for pattern in self.company_noise_regex:
+                contact.company = pattern.sub('', contact.company)
             contact.company = ' '.join(contact.company.split())  # Remove extra spaces
         
         # Clean phone numbers
         cleaned_phones = []
         for phone in contact.phone:
-            # Remove non-numeric except +, -, (, )
-            cleaned = re.sub(r'[^\d\+\-\(\)\s]', '', phone)
+            # Remove non-numeric except +, -, (, ) - a translate for ASCII
+            # numbers, the regex only when Unicode digits/spaces may occur
+            if phone.isascii():
+                cleaned = phone.translate(_DELETE_PHONE_NOISE)
+            else:
+                cleaned = self.PHONE_NOISE_REGEX.sub('', phone)
             if cleaned:
                 cleaned_phones.append(cleaned)
         contact.phone = cleaned_phones
@@ -193,6 +231,11 @@ class ContactPostProcessor:
         return min(valid_count / 6, 1.0)
 
 
+# Shared processor - it keeps no per-contact state, so every call (and
+# thread) can use the same one
+_PROCESSOR = ContactPostProcessor()
+
+
 # Helper functions
 def postprocess_contact(raw_contact: Dict) -> Dict:
     """
@@ -204,8 +247,7 @@ def postprocess_contact(raw_contact: Dict) -> Dict:
     Returns:
         Cleaned and structured contact dictionary
     """
-    processor = ContactPostProcessor()
-    structured = processor.process(raw_contact)
+    structured = _PROCESSOR.process(raw_contact)
     
     return {
     'name': structured.name,
@@ -5,16 +5,51 @@ Enriches contact data using free APIs (Hunter, Abstract, GitHub).
 """
 
 import logging
+import threading
 import time
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .parser import ContactData
 
 logger = logging.getLogger(__name__)
 
 
+def build_http_session(pool_size: int = 32, retries: int = 3) -> requests.Session:
+    """Create a keep-alive HTTP session shared by the enrichment clients.
+    
+    Connections to each API host are pooled and reused across cards, so
+    only the first request pays for DNS and the TLS handshake. Transient
+    5xx responses and connection errors are retried with backoff; 429s are
+    not, since the free-tier quotas reset far later than a retry would.
+    
+    Args:
+        pool_size: Connections kept open per host
+        retries: Retries of a failed idempotent request
+        
+    Returns:
+        Configured requests.Session
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False
+        )
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 @dataclass
 class EnrichedData:
     """Enriched contact data from external APIs.
@@ -52,6 +87,36 @@ class EnrichedData:
         }
 
 
+class _TokenBucket:
+    """Thread-safe token bucket allowing `rate` calls per second."""
+    
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize the bucket full.
+        
+        Args:
+            rate: Calls allowed per second on average
+            burst: Calls allowed back to back after an idle period
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token even if it is not there yet; waiting callers
+            # queue up behind each other instead of racing for the refill
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
 class ContactResearcher:
     """Enriches contact data using free API tiers.
     
@@ -71,11 +136,24 @@ class ContactResearcher:
     # Request timeout in seconds
     TIMEOUT = 10
     
+    # Requests per second and burst per API, kept under the free-tier
+    # limits so parallel batches are paced instead of hitting 429s
+    RATE_LIMITS = {
+        "hunter": (10.0, 10),
+        "abstract": (1.0, 1),
+        "github": (0.5, 5),  # Search API: 30 requests/minute
+    }
+    
+    # Hunter domain searches kept per researcher; cards from one company
+    # share the lookup
+    DOMAIN_CACHE_SIZE = 1024
+    
     def __init__(
         self,
         hunter_api_key: Optional[str] = None,
         abstract_api_key: Optional[str] = None,
-        github_token: Optional[str] = None
+        github_token: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ) -> None:
         """Initialize the ContactResearcher.
         
@@ -83,10 +161,17 @@ class ContactResearcher:
             hunter_api_key: Hunter.io API key (optional)
             abstract_api_key: Abstract API key (optional)
             github_token: GitHub personal access token (optional)
+            session: HTTP session to reuse connections on (optional)
         """
         self.hunter_api_key = hunter_api_key
         self.abstract_api_key = abstract_api_key
         self.github_token = github_token
+        self.session = session or build_http_session()
+        self._limiters = {
+            api: _TokenBucket(rate, burst) for api, (rate, burst) in self.RATE_LIMITS.items()
+        }
+        # Failed lookups raise, so only successful ones are cached
+        self._search_domain_cached = lru_cache(maxsize=self.DOMAIN_CACHE_SIZE)(self._search_domain_hunter)
         
         # Track API usage
         self._api_calls = {
@@ -186,7 +271,7 @@ class ContactResearcher:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=self.TIMEOUT)
+            response = self._get("hunter", url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             self._api_calls["hunter"] += 1
@@ -218,7 +303,7 @@ class ContactResearcher:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=self.TIMEOUT)
+            response = self._get("abstract", url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             self._api_calls["abstract"] += 1
@@ -253,7 +338,7 @@ class ContactResearcher:
         # Try Hunter.io domain search for company info
         if domain and self.hunter_api_key:
             try:
-                result = self._search_domain_hunter(domain)
+                result = self._search_domain_cached(domain)
                 if result:
                     enriched.company_info = {
                         "domain": domain,
@@ -298,7 +383,7 @@ class ContactResearcher:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=self.TIMEOUT)
+            response = self._get("hunter", url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             self._api_calls["hunter"] += 1
@@ -362,7 +447,8 @@ class ContactResearcher:
         params = {"q": f"{email} in:email"}
         
         try:
-            response = requests.get(
+            response = self._get(
+                "github",
                 url, 
                 headers=headers, 
                 params=params, 
@@ -398,7 +484,8 @@ class ContactResearcher:
         params = {"q": f"{name} in:name"}
         
         try:
-            response = requests.get(
+            response = self._get(
+                "github",
                 url, 
                 headers=headers, 
                 params=params, 
@@ -434,7 +521,7 @@ class ContactResearcher:
         url = f"{self.GITHUB_API_URL}/users/{username}"
         
         try:
-            response = requests.get(url, headers=headers, timeout=self.TIMEOUT)
+            response = self._get("github", url, headers=headers, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             self._api_calls["github"] += 1
@@ -459,6 +546,20 @@ class ContactResearcher:
             logger.error(f"GitHub user details failed: {str(e)}")
             raise
     
+    def _get(self, api: str, url: str, **kwargs) -> requests.Response:
+        """Send a GET request once the API's rate limit allows it.
+        
+        Args:
+            api: Key into RATE_LIMITS
+            url: Request URL
+            **kwargs: Passed to requests.Session.get
+            
+        Returns:
+            Response object
+        """
+        self._limiters[api].acquire()
+        return self.session.get(url, **kwargs)
+    
     def _get_github_headers(self) -> Dict[str, str]:
         """Get headers for GitHub API requests."""
         headers = {
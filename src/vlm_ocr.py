@@ -8,15 +8,25 @@ Free tier: 1500 requests/day
 
 import os
 import base64
+import hashlib
 import json
 import logging
+import random
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Dict, Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 logger = logging.getLogger(__name__)
 
+# JSON wrapped in a markdown code block, or any {...} span in the response
+_JSON_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
 # Try to import google genai (new package)
 try:
     from google import genai
@@ -98,17 +108,58 @@ Rules:
 - If a field is not visible, use null
 - Return ONLY valid JSON, no markdown or explanation"""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash"):
+    # Backoff between retries of a rate-limited call: base * 2**attempt
+    # seconds, capped, plus up to 1s of jitter
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+
+    # Circuit breaker: after this many failed requests in a row, skip
+    # Gemini for BREAKER_RESET seconds instead of waiting on each card,
+    # then let a single trial request through before resuming
+    BREAKER_FAILURES = 5
+    BREAKER_RESET = 60.0
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-2.5-flash",
+        max_concurrency: int = 2,
+        max_retries: int = 3,
+        cache_size: int = 256,
+        cache_ttl: float = 600.0
+    ):
         """
         Initialize Gemini OCR.
         
         Args:
             api_key: Google API key (or set GOOGLE_API_KEY env var)
             model: Model to use (gemini-2.5-flash, gemini-2.0-flash-exp, gemini-1.5-flash, gemini-1.5-pro)
+            max_concurrency: Gemini requests allowed in flight at once across threads
+            max_retries: Retries of a request rejected for rate limit or quota
+            cache_size: Successful results kept, keyed by image content
+            cache_ttl: Seconds a cached result stays valid (0 = no caching)
         """
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
         self.model_name = model
         self.model = None
+        self.max_retries = max(0, max_retries)
+        self._request_slots = threading.BoundedSemaphore(max(1, max_concurrency))
+        
+        # Results by image hash -> (expiry time, result), oldest first
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Requests in progress by image hash, so concurrent requests for the
+        # same card share one Gemini call (guarded by _cache_lock)
+        self._in_flight: Dict[bytes, Future] = {}
+        
+        # Consecutive failed requests, when paused requests may resume, and
+        # the thread making the trial request after a pause (if any)
+        self._breaker_lock = threading.Lock()
+        self._breaker_failures = 0
+        self._breaker_open_until = 0.0
+        self._breaker_probe: Optional[int] = None
         
         if not GEMINI_AVAILABLE:
             logger.error("google-generativeai package not installed")
@@ -138,11 +189,14 @@ Rules:
             return hasattr(self, 'client') and self.client is not None
         return self.model is not None
     
-    def _load_image(self, image_path: Path) -> Optional[Dict]:
-        """Load image and prepare for Gemini API."""
+    def _load_image(self, image_path: Path, image_bytes: Optional[bytes] = None) -> Optional[Dict]:
+        """Load image (unless its bytes are given) and prepare for Gemini API."""
         try:
-            with open(image_path, "rb") as f:
-                image_data = f.read()
+            if image_bytes is not None:
+                image_data = image_bytes
+            else:
+                with open(image_path, "rb") as f:
+                    image_data = f.read()
             
             # Determine mime type
             suffix = image_path.suffix.lower()
@@ -158,7 +212,9 @@ Rules:
             
             return {
                 "mime_type": mime_type,
-                "data": base64.b64encode(image_data).decode("utf-8")
+                "data": base64.b64encode(image_data).decode("utf-8"),
+                # Raw file contents, so requests never re-read the file
+                "bytes": image_data
             }
         except Exception as e:
             logger.error(f"Failed to load image: {e}")
@@ -171,7 +227,7 @@ Rules:
             return json.loads(response_text)
         except json.JSONDecodeError:
             # Try to extract JSON from markdown code block
-            json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response_text)
+            json_match = _JSON_CODE_BLOCK_RE.search(response_text)
             if json_match:
                 try:
                     return json.loads(json_match.group(1))
@@ -179,7 +235,7 @@ Rules:
                     pass
             
             # Try to find JSON object in text
-            json_match = re.search(r'\{[\s\S]*\}', response_text)
+            json_match = _JSON_OBJECT_RE.search(response_text)
             if json_match:
                 try:
                     return json.loads(json_match.group(0))
@@ -188,10 +244,175 @@ Rules:
         
         return {}
     
+    @staticmethod
+    def _is_rate_limited(error: Exception) -> bool:
+        """Check whether an API error is a rate-limit or quota rejection."""
+        status = getattr(error, "code", None) or getattr(error, "status_code", None)
+        if status == 429:
+            return True
+        message = str(error).lower()
+        return any(
+            marker in message
+            for marker in ("429", "rate limit", "quota", "resource_exhausted", "resource exhausted")
+        )
+    
+    def _circuit_open(self) -> bool:
+        """
+        Check whether Gemini requests are paused after repeated failures.
+        
+        Once the pause is over, the first caller is let through as the trial
+        request; everyone else stays paused until that request is recorded.
+        """
+        with self._breaker_lock:
+            if self._breaker_failures < self.BREAKER_FAILURES:
+                return False
+            if time.monotonic() < self._breaker_open_until or self._breaker_probe is not None:
+                return True
+            self._breaker_probe = threading.get_ident()
+            return False
+    
+    def _release_probe(self) -> None:
+        """Give up this thread's trial request if it never reached Gemini."""
+        with self._breaker_lock:
+            if self._breaker_probe == threading.get_ident():
+                self._breaker_probe = None
+    
+    def _record_request(self, failed: bool) -> None:
+        """
+        Track request outcomes, pausing requests after too many failures.
+        
+        Args:
+            failed: Whether the request (after its retries) failed
+        """
+        with self._breaker_lock:
+            if self._breaker_probe == threading.get_ident():
+                self._breaker_probe = None
+            if not failed:
+                self._breaker_failures = 0
+                return
+            
+            self._breaker_failures += 1
+            if self._breaker_failures >= self.BREAKER_FAILURES:
+                # Also reached by a failed trial request, which pauses again
+                self._breaker_open_until = time.monotonic() + self.BREAKER_RESET
+                logger.warning(
+                    f"Gemini failed {self.BREAKER_FAILURES} times in a row; "
+                    f"pausing requests for {self.BREAKER_RESET:.0f}s"
+                )
+    
+    def _generate_with_backoff(self, image_path: Path, image_data: Dict) -> str:
+        """
+        Call Gemini, retrying rate-limited requests with exponential backoff.
+        
+        At most max_concurrency calls run at once; a thread waiting out a
+        backoff does not hold a slot.
+        
+        Args:
+            image_path: Path to business card image
+            image_data: Image payload from _load_image
+            
+        Returns:
+            Response text
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self._request_slots:
+                    return self._generate(image_path, image_data)
+            except ImportError:
+                raise
+            except Exception as e:
+                if attempt == self.max_retries or not self._is_rate_limited(e):
+                    raise
+                delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+                delay += random.uniform(0, 1)
+                logger.warning(
+                    f"Gemini rate limited ({e}); retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+    
+    def _generate(self, image_path: Path, image_data: Dict) -> str:
+        """
+        Make one Gemini request for a business card image.
+        
+        Args:
+            image_path: Path to business card image
+            image_data: Image payload from _load_image
+            
+        Returns:
+            Response text
+        """
+        if hasattr(self, 'use_new_api') and self.use_new_api:
+            # New google-genai API
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=[
+                    types.Content(
+                        parts=[
+                            types.Part.from_text(text=self.EXTRACTION_PROMPT),
+                            types.Part.from_bytes(data=image_data["bytes"], mime_type=image_data["mime_type"])
+                        ]
+                    )
+                ],
+                config=types.GenerateContentConfig(
+                    temperature=0.1,
+                    max_output_tokens=1024
+                )
+            )
+            return response.text
+        
+        # Old google-generativeai API - fallback for compatibility
+        image_part = {
+            "inline_data": {"mime_type": image_data["mime_type"], "data": image_data["data"]}
+        }
+        
+        # Import the old package if needed (ImportError goes to the caller)
+        import google.generativeai as old_genai
+        if not hasattr(self, 'old_model'):
+            old_genai.configure(api_key=self.api_key)
+            self.old_model = old_genai.GenerativeModel(self.model_name)
+        
+        response = self.old_model.generate_content(
+            [self.EXTRACTION_PROMPT, image_part],
+            generation_config={
+                "temperature": 0.1,
+                "max_output_tokens": 1024
+            }
+        )
+        return response.text
+    
+    def _cache_get(self, key: bytes) -> Optional[VLMResult]:
+        """Get an unexpired cached result."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return result
+    
+    def _cache_put(self, key: bytes, result: VLMResult) -> None:
+        """Store a result, evicting the least recently used beyond cache_size."""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    @staticmethod
+    def _copy_result(result: VLMResult) -> VLMResult:
+        """Copy a cached result so callers cannot modify the cached one."""
+        return replace(result, phone=list(result.phone) if result.phone else result.phone)
+    
     def extract(self, image_path: Path) -> VLMResult:
         """
         Extract contact information from business card image.
         
+        Successful results are cached by image content for cache_ttl
+        seconds, so a re-uploaded card does not pay for another request.
+        
         Args:
             image_path: Path to business card image
             
@@ -204,62 +425,91 @@ Rules:
                 error="Gemini not configured. Set GOOGLE_API_KEY environment variable."
             )
         
+        if self.cache_ttl <= 0 or self.cache_size <= 0:
+            return self._extract_uncached(image_path)
+        
+        try:
+            image_bytes = Path(image_path).read_bytes()
+        except OSError as e:
+            logger.error(f"Failed to load image: {e}")
+            return VLMResult(success=False, error="Failed to load image")
+        key = hashlib.blake2b(
+            image_bytes + self.model_name.encode("utf-8"), digest_size=16
+        ).digest()
+        
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.info(f"Gemini cache hit for: {image_path}")
+            return self._copy_result(cached)
+        
+        # Join a request already in progress for this image, or start one
+        with self._cache_lock:
+            pending = self._in_flight.get(key)
+            if pending is None:
+                pending = self._in_flight[key] = Future()
+                leader = True
+            else:
+                leader = False
+        
+        if not leader:
+            # Every waiter gets its own copy of the shared result
+            return self._copy_result(pending.result())
+        
+        try:
+            # A request that finished since the lookup above has cached its
+            # result before leaving _in_flight
+            result = self._cache_get(key)
+            if result is None:
+                result = self._extract_uncached(image_path, image_bytes)
+                if result.success:
+                    self._cache_put(key, result)
+            pending.set_result(result)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                del self._in_flight[key]
+        
+        return self._copy_result(result) if result.success else result
+    
+    def _extract_uncached(self, image_path: Path, image_bytes: Optional[bytes] = None) -> VLMResult:
+        """
+        Extract contact information with a Gemini request.
+        
+        Args:
+            image_path: Path to business card image
+            image_bytes: Image file contents, if already read
+            
+        Returns:
+            VLMResult with extracted data
+        """
+        if self._circuit_open():
+            return VLMResult(
+                success=False,
+                error="Gemini requests paused after repeated failures"
+            )
+        
         try:
             # Load image
-            image_data = self._load_image(Path(image_path))
+            image_data = self._load_image(Path(image_path), image_bytes)
             if not image_data:
                 return VLMResult(success=False, error="Failed to load image")
             
             # Call Gemini API
             logger.info(f"Calling Gemini API for: {image_path}")
             
-            if hasattr(self, 'use_new_api') and self.use_new_api:
-                # New google-genai API
-                with open(image_path, "rb") as f:
-                    image_bytes = f.read()
-                
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=[
-                        types.Content(
-                            parts=[
-                                types.Part.from_text(text=self.EXTRACTION_PROMPT),
-                                types.Part.from_bytes(data=image_bytes, mime_type=image_data["mime_type"])
-                            ]
-                        )
-                    ],
-                    config=types.GenerateContentConfig(
-                        temperature=0.1,
-                        max_output_tokens=1024
-                    )
+            try:
+                response_text = self._generate_with_backoff(Path(image_path), image_data)
+            except ImportError:
+                return VLMResult(
+                    success=False,
+                    error="Neither google-genai nor google-generativeai package available"
                 )
-                response_text = response.text
-            else:
-                # Old google-generativeai API - fallback for compatibility
-                image_part = {
-                    "inline_data": image_data
-                }
-                
-                # Import the old package if needed
-                try:
-                    import google.generativeai as old_genai
-                    if not hasattr(self, 'old_model'):
-                        old_genai.configure(api_key=self.api_key)
-                        self.old_model = old_genai.GenerativeModel(self.model_name)
-                    
-                    response = self.old_model.generate_content(
-                        [self.EXTRACTION_PROMPT, image_part],
-                        generation_config={
-                            "temperature": 0.1,
-                            "max_output_tokens": 1024
-                        }
-                    )
-                    response_text = response.text
-                except ImportError:
-                    return VLMResult(
-                        success=False,
-                        error="Neither google-genai nor google-generativeai package available"
-                    )
+            except Exception:
+                self._record_request(failed=True)
+                raise
+            self._record_request(failed=False)
             
             logger.debug(f"Gemini response: {response_text[:500]}")
             
@@ -302,6 +552,8 @@ Rules:
         except Exception as e:
             logger.error(f"Gemini extraction failed: {e}", exc_info=True)
             return VLMResult(success=False, error=str(e))
+        finally:
+            self._release_probe()
     
     def extract_batch(self, image_paths: List[Path]) -> List[VLMResult]:
         """
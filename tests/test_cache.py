@@ -0,0 +1,57 @@
+"""
+Tests for the OCR result cache.
+"""
+
+import pytest
+from src._cache import OCRResultCache
+
+
+class TestOCRResultCache:
+    """Test cases for OCRResultCache."""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create cache in a temp folder."""
+        return OCRResultCache(str(tmp_path / "ocr_cache.sqlite3"))
+    
+    def test_miss_returns_none(self, cache):
+        """Test lookup of an unknown key."""
+        key = OCRResultCache.make_key(b"image", {"languages": ["en"]})
+        assert cache.get(key) is None
+    
+    def test_round_trip(self, cache):
+        """Test stored results are returned unchanged."""
+        results = [([[0, 0], [10, 0], [10, 5], [0, 5]], "John Doe", 0.98)]
+        key = OCRResultCache.make_key(b"image", {"languages": ["en"]})
+        
+        cache.set(key, results)
+        
+        assert cache.get(key) == results
+    
+    def test_key_depends_on_params(self):
+        """Test different OCR parameters give different keys."""
+        key_en = OCRResultCache.make_key(b"image", {"languages": ["en"]})
+        key_fr = OCRResultCache.make_key(b"image", {"languages": ["fr"]})
+        
+        assert key_en != key_fr
+
+    def test_numpy_values_round_trip(self, cache):
+        """Test NumPy coordinates and confidences are stored as plain numbers."""
+        import numpy as np
+        results = [(np.array([[0, 0], [10, 0], [10, 5], [0, 5]]), "Acme", np.float64(0.9))]
+        key = OCRResultCache.make_key(b"image", {"languages": ["en"]})
+
+        cache.set(key, results)
+
+        assert cache.get(key) == [([[0, 0], [10, 0], [10, 5], [0, 5]], "Acme", 0.9)]
+
+    def test_entries_are_not_unpickled(self, cache):
+        """Test a pickled row is treated as a miss instead of being loaded."""
+        import pickle
+        key = OCRResultCache.make_key(b"image", {"languages": ["en"]})
+        cache._connect().execute(
+            "INSERT INTO ocr_cache (key, results) VALUES (?, ?)",
+            (key, pickle.dumps([([[0, 0]], "x", 1.0)]))
+        )
+
+        assert cache.get(key) is None
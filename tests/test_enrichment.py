@@ -0,0 +1,33 @@
+"""
+Tests for CompanyEnricher class.
+"""
+
+import pytest
+from src.enrichment import CompanyEnricher
+
+
+class TestCompanyEnricher:
+    """Test cases for CompanyEnricher."""
+
+    @pytest.fixture
+    def enricher(self):
+        """Create enricher instance."""
+        return CompanyEnricher()
+
+    def test_enrich_from_email_domain(self, enricher):
+        """Test a business email supplies the domain and logo URL."""
+        result = enricher.enrich(company_name="Acme Software", email="jo@acme.io")
+
+        assert result.domain == "acme.io"
+        assert result.logo_url == f"{CompanyEnricher.CLEARBIT_LOGO_URL}/acme.io"
+        assert result.industry == "technology"
+
+    def test_same_company_is_enriched_once(self, enricher):
+        """Test cards sharing company and domain reuse one cached result."""
+        first = enricher.enrich(company_name="Acme Software", email="jo@acme.io")
+        first.enrichment_sources.append("changed")
+        second = enricher.enrich(company_name="Acme Software", website="https://www.acme.io")
+
+        assert enricher._enrich_cached.cache_info().hits == 1
+        assert second is not first
+        assert "changed" not in second.enrichment_sources
@@ -0,0 +1,55 @@
+"""
+Tests for the keyword matcher used by the parser.
+"""
+
+import pytest
+from src import _keywords
+from src._keywords import KeywordCategories, KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher."""
+    
+    @pytest.fixture
+    def matcher(self):
+        """Create matcher over overlapping title keywords."""
+        return KeywordMatcher(["president", "vp", "vice president", "lead"])
+    
+    def test_search(self, matcher):
+        """Test substring presence matches the naive any() scan."""
+        assert matcher.search("senior vice president")
+        assert matcher.search("team leader")  # substring, not word match
+        assert not matcher.search("software engineer")
+        assert not matcher.search("")
+    
+    def test_first_uses_list_priority(self, matcher):
+        """Test the earliest keyword in the list wins, not the earliest in the text."""
+        assert matcher.first("vice president, sales") == "president"
+        assert matcher.first("lead vp") == "vp"
+        assert matcher.first("engineer") is None
+    
+    def test_duplicate_keywords(self):
+        """Test duplicated keywords keep their first position."""
+        matcher = KeywordMatcher(["consulting", "media", "consulting"])
+        assert matcher.keywords == ["consulting", "media"]
+        assert matcher.first("media consulting") == "consulting"
+
+
+class TestKeywordCategories:
+    """Test cases for KeywordCategories."""
+    
+    @pytest.mark.parametrize("automaton", [True, False])
+    def test_search_reports_every_hit_category(self, monkeypatch, automaton):
+        """Test shared and overlapping keywords report all their categories."""
+        if automaton and not _keywords.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+        monkeypatch.setattr(_keywords, "AHOCORASICK_AVAILABLE", automaton)
+        matcher = KeywordCategories({
+            "skip": ["linkedin", "www"],
+            "dot": [".inc", "inc."],
+            "weak": ["inc", "media"],
+        })
+        
+        assert matcher.search("acme.inc") == {"dot", "weak"}
+        assert matcher.search("www.media.com") == {"skip", "weak"}
+        assert matcher.search("john doe") == frozenset()
@@ -0,0 +1,46 @@
+"""
+Tests for the OCR text corrections in OCRExtractor.
+"""
+
+import re
+
+import pytest
+from src.ocr import OCRExtractor, _OCR_FIXES
+
+
+class TestOCRTextCorrection:
+    """Test cases for OCRExtractor._correct_ocr_text."""
+
+    @pytest.fixture
+    def extractor(self):
+        """Create extractor instance (the reader is built lazily)."""
+        return OCRExtractor(gpu=False)
+
+    @staticmethod
+    def _sequential(extractor, text):
+        """Reference: every word correction as its own pass, in dict order."""
+        for wrong, correct in extractor.word_corrections.items():
+            text = re.sub(re.escape(wrong), correct, text, flags=re.IGNORECASE)
+        for pattern, replacement, _ in _OCR_FIXES:
+            text = pattern.sub(replacement, text)
+        return ' '.join(text.split())
+
+    @pytest.mark.parametrize("text", [
+        "Ana1yst at S0lutions Inc",
+        "SENIOR DEVE1OPER",
+        "1obster Ca1ifornia",
+        "emai1: jo@acme . com",
+        "Plain line without fixes",
+    ])
+    def test_space_separated_matches_sequential(self, extractor, text):
+        """Test separated words are corrected as by one pass per correction."""
+        assert extractor._correct_ocr_text(text) == self._sequential(extractor, text)
+
+    @pytest.mark.parametrize("text", ["Adm1nc0m", "Eng1neerManag3r", "Deve1oper1obster"])
+    def test_run_together_matches_sequential(self, extractor, text):
+        """Test run-together tokens see each correction's output in turn."""
+        assert extractor._correct_ocr_text(text) == self._sequential(extractor, text)
+
+    def test_chained_correction(self, extractor):
+        """Test a correction's output is rewritten by a later correction."""
+        assert extractor._correct_ocr_text("1obster") == "Lobster"
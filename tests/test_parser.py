@@ -125,6 +125,50 @@ class TestContactParser:
         assert result.confidence_score == 0.0
         assert not result.is_valid()
     
+    def test_parse_huge_text_is_capped(self, parser):
+        """Test oversized input is only scanned up to the parser limits."""
+        text = "John Doe\njohn@example.com\n" + "filler line\n" * 10000
+        
+        result = parser.parse(text)
+        
+        assert result.email == "john@example.com"
+        assert result.raw_text.count("filler line") == 10000
+
+    def test_extractors_ignore_text_past_scan_cap(self, parser):
+        """Test contact details beyond MAX_SCAN_CHARS are kept in raw_text only."""
+        filler = "x" * 80 + "\n"
+        text = "John Doe\n" + filler * (parser.MAX_SCAN_CHARS // len(filler) + 1) + "late@example.com"
+
+        result = parser.parse(text)
+
+        assert result.email == ""
+        assert result.raw_text.endswith("late@example.com")
+
+    def test_parse_long_card_keeps_late_contact_fields(self, parser):
+        """Test contact details after MAX_SCAN_LINES lines are still extracted."""
+        lines = ["John Doe", "Software Engineer", "Acme Corp"]
+        lines += [f"Office {i}" for i in range(parser.MAX_SCAN_LINES)]
+        lines += ["john@acme.com", "555-123-4567"]
+
+        result = parser.parse("\n".join(lines))
+
+        assert result.name == "John Doe"
+        assert result.email == "john@acme.com"
+        assert result.phone
+        assert "555-123-4567" in result.raw_text
+
+    def test_parse_repeated_text_is_cached(self, parser):
+        """Test re-parsing the same text hits the cache but returns a fresh contact."""
+        text = "John Doe\nSoftware Engineer\njohn@example.com"
+
+        first = parser.parse(text)
+        first.name = "Changed"
+        second = parser.parse(text)
+
+        assert parser._parse_text_cached.cache_info().hits == 1
+        assert second.name == "John Doe"
+        assert second is not first
+
     def test_contact_data_to_dict(self, parser):
         """Test ContactData serialization."""
         contact = ContactData(
@@ -150,7 +194,51 @@ class TestContactParser:
         
         assert len(results) == 2
         assert all(isinstance(r, ContactData) for r in results)
+
+    def test_parse_batch_with_workers_matches_serial(self, parser, monkeypatch):
+        """Test a batch spread over worker processes keeps results and order."""
+        monkeypatch.setattr(ContactParser, "PARALLEL_BATCH_MIN", 4)
+        texts = [
+            "John Doe\njohn@example.com",
+            "Jane Smith\nCEO\njane@company.org",
+            "Acme Widgets Inc\n555-123-4567",
+            "",
+            "Mary Jones\nwww.example.com",
+        ]
+
+        results = parser.parse_batch(texts, workers=2)
+
+        assert results == parser.parse_batch(texts)
+
+    def test_extract_name_prefers_common_first_name(self, parser):
+        """Test a later common first name outranks an earlier plain name."""
+        lines = [
+            "Acme Widgets",
+            "Senior Engineer",
+            "Mary Jones",
+            "Kyle Reese"
+        ]
+        
+        result = parser._extract_name(lines)
+        
+        assert result == "Mary Jones"
     
+    def test_matching_patterns(self, parser):
+        """Test the pattern prescan reports every pattern that matches."""
+        text = "John Doe john@example.com linkedin.com/in/johndoe"
+        
+        fired = parser._matching_patterns(text)
+        
+        assert {"email", "linkedin", "website"} <= fired
+
+    def test_matching_patterns_without_re2(self, parser, monkeypatch):
+        """Test the substring prescan skips patterns that cannot match."""
+        monkeypatch.setattr(parser, "_PATTERN_SET", None)
+
+        assert parser._matching_patterns("John Doe\nAcme Widgets") == frozenset()
+        assert parser._matching_patterns("john@example.com") >= {"email", "website", "twitter"}
+        assert "phone" not in parser._matching_patterns("john@example.com")
+
     def test_extract_title(self, parser):
         """Test job title extraction."""
         lines = [
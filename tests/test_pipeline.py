@@ -156,7 +156,87 @@ class TestCardResearchPipeline:
         assert result["total_images"] == 3
         assert result["processed"] == 3
         assert result["failed"] == 0
-    
+
+    def test_process_batch_parallel_keeps_order(self, tmp_path):
+        """Test a batch spread over threads returns results in input order."""
+        pipeline = CardResearchPipeline(output_folder=str(tmp_path), batch_workers=3)
+        image_paths = [tmp_path / f"card_{i}.jpg" for i in range(5)]
+
+        def fake_process_image(path, enrich=True, force_gemini=False, ocr_result=None):
+            return {"success": path.name != "card_2.jpg", "image": str(path)}
+
+        with patch.object(pipeline, "process_image", side_effect=fake_process_image):
+            result = pipeline.process_batch(image_paths)
+
+        assert [r["image"] for r in result["results"]] == [str(p) for p in image_paths]
+        assert result["successful"] == 4
+        assert result["failed"] == 1
+
+    def test_ocr_concurrency_caps_parallel_ocr(self, tmp_path):
+        """Test batch workers never run more OCR calls at once than ocr_concurrency."""
+        import threading
+        import time
+
+        pipeline = CardResearchPipeline(
+            output_folder=str(tmp_path), batch_workers=4, ocr_concurrency=1
+        )
+        lock = threading.Lock()
+        active = [0, 0]  # current, peak
+
+        def fake_extract_text(path):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return {"success": False, "raw_text": "", "confidence": 0.0}
+
+        with patch.object(pipeline.ocr, "extract_text", side_effect=fake_extract_text):
+            pipeline.process_batch([tmp_path / f"card_{i}.jpg" for i in range(6)], enrich=False)
+
+        assert active[1] == 1
+
+    def test_process_batch_iter_yields_every_result(self, tmp_path):
+        """Test streamed batch processing yields one result per image."""
+        pipeline = CardResearchPipeline(output_folder=str(tmp_path), batch_workers=3)
+        image_paths = [tmp_path / f"card_{i}.jpg" for i in range(5)]
+
+        def fake_process_image(path, enrich=True, force_gemini=False, ocr_result=None):
+            return {"success": True, "image": str(path)}
+
+        with patch.object(pipeline, "process_image", side_effect=fake_process_image):
+            results = list(pipeline.process_batch_iter(image_paths))
+
+        assert sorted(r["image"] for r in results) == sorted(str(p) for p in image_paths)
+
+    def test_gemini_client_built_on_first_use(self, tmp_path):
+        """Test the Gemini client is only created when first needed, once."""
+        with patch("src.pipeline.GeminiOCR") as gemini_class:
+            pipeline = CardResearchPipeline(output_folder=str(tmp_path), gemini_api_key="key")
+            gemini_class.assert_not_called()
+
+            assert pipeline.gemini_ocr is gemini_class.return_value
+            assert pipeline.gemini_ocr is gemini_class.return_value
+            gemini_class.assert_called_once()
+
+    def test_low_confidence_skips_parse_for_gemini(self, pipeline, tmp_path):
+        """Test a low-confidence card goes to Gemini without being parsed first."""
+        pipeline._gemini_ocr = Mock()
+        pipeline._gemini_ready = True
+        gemini_contact = {"name": "John Doe", "email": "john@example.com", "confidence_score": 0.95}
+
+        with patch.object(pipeline.ocr, "extract_text",
+                          return_value={"success": True, "raw_text": "J0hn D0e", "confidence": 0.3}), \
+             patch.object(pipeline.parser, "parse_from_image_text") as parse, \
+             patch.object(pipeline, "_process_with_gemini", return_value=gemini_contact) as gemini:
+            result = pipeline.process_image(tmp_path / "card.jpg", enrich=False)
+
+        parse.assert_not_called()
+        gemini.assert_called_once()
+        assert result["success"] is True
+        assert result["ocr_method"] == "gemini_fallback"
+
     def test_generate_csv(self, pipeline, tmp_path):
         """Test CSV generation."""
         results = [
@@ -77,7 +77,7 @@ class TestFreeLeadResearcher:
         assert "github" in usage
         assert all(v == 0 for v in usage.values())
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_verify_email_hunter(self, mock_get, researcher_with_keys):
         """Test Hunter.io email verification."""
         mock_response = Mock()
@@ -97,7 +97,7 @@ class TestFreeLeadResearcher:
         assert result["status"] == "valid"
         assert result["score"] == 95
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_verify_email_hunter_error(self, mock_get, researcher_with_keys):
         """Test Hunter.io error handling."""
         mock_get.side_effect = requests.exceptions.RequestException("API Error")
@@ -105,7 +105,7 @@ class TestFreeLeadResearcher:
         with pytest.raises(requests.exceptions.RequestException):
             researcher_with_keys._verify_email_hunter("test@example.com")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_validate_email_abstract(self, mock_get, researcher_with_keys):
         """Test Abstract API email validation."""
         mock_response = Mock()
@@ -122,7 +122,7 @@ class TestFreeLeadResearcher:
         assert result is not None
         assert result["deliverability"] == "DELIVERABLE"
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_github_user_search(self, mock_get, researcher_with_keys):
         """Test GitHub user search."""
         # Mock search response
@@ -170,7 +170,7 @@ class TestFreeLeadResearcher:
         assert "Authorization" in headers
         assert "token test_github_token" in headers["Authorization"]
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_full_enrichment(self, mock_get, researcher_with_keys):
         """Test full enrichment pipeline."""
         # Mock all API responses
@@ -194,7 +194,7 @@ class TestFreeLeadResearcher:
         assert len(result.enrichment_sources) > 0 or len(result.enrichment_errors) > 0
     
     @patch('time.sleep')  # Speed up test
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_enrich_batch(self, mock_get, mock_sleep, researcher):
         """Test batch enrichment."""
         contacts = [
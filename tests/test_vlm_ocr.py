@@ -0,0 +1,210 @@
+"""
+Tests for the Gemini request throttling in GeminiOCR.
+"""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from src import vlm_ocr
+from src.vlm_ocr import GeminiOCR
+
+
+class RateLimitError(Exception):
+    """Stand-in for the client's HTTP 429 error."""
+    code = 429
+
+
+class TestGeminiBackoff:
+    """Test cases for GeminiOCR retry and backoff."""
+
+    @pytest.fixture
+    def gemini(self, monkeypatch):
+        """Create an unconfigured GeminiOCR whose backoff does not sleep."""
+        sleeps = []
+        monkeypatch.setattr(vlm_ocr.time, "sleep", sleeps.append)
+        ocr = GeminiOCR(api_key=None, max_retries=2)
+        ocr.sleeps = sleeps
+        return ocr
+
+    def test_rate_limited_call_is_retried(self, gemini, monkeypatch):
+        """Test 429s are retried with growing delays until the call succeeds."""
+        outcomes = [RateLimitError("429"), RateLimitError("429"), "{}"]
+
+        def fake_generate(image_path, image_data):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(gemini, "_generate", fake_generate)
+
+        assert gemini._generate_with_backoff(Path("card.jpg"), {}) == "{}"
+        assert len(gemini.sleeps) == 2
+        assert gemini.sleeps[1] >= GeminiOCR.RETRY_BASE_DELAY * 2
+
+    def test_other_errors_are_not_retried(self, gemini, monkeypatch):
+        """Test a non-rate-limit error is raised on the first attempt."""
+        def fake_generate(image_path, image_data):
+            raise ValueError("bad request")
+
+        monkeypatch.setattr(gemini, "_generate", fake_generate)
+
+        with pytest.raises(ValueError):
+            gemini._generate_with_backoff(Path("card.jpg"), {})
+        assert gemini.sleeps == []
+
+    def test_quota_message_counts_as_rate_limit(self):
+        """Test quota errors without a status code are recognised."""
+        assert GeminiOCR._is_rate_limited(Exception("RESOURCE_EXHAUSTED: quota exceeded"))
+        assert not GeminiOCR._is_rate_limited(Exception("invalid image"))
+
+
+class TestGeminiResultCache:
+    """Test cases for the GeminiOCR result cache."""
+
+    @pytest.fixture
+    def gemini(self, monkeypatch):
+        """Create a GeminiOCR that counts its (fake) Gemini requests."""
+        ocr = GeminiOCR(api_key=None)
+        ocr.calls = 0
+
+        def fake_extract(image_path, image_bytes=None):
+            ocr.calls += 1
+            return vlm_ocr.VLMResult(success=True, name="John Doe", phone=["5551234567"])
+
+        monkeypatch.setattr(ocr, "is_available", lambda: True)
+        monkeypatch.setattr(ocr, "_extract_uncached", fake_extract)
+        return ocr
+
+    def test_same_image_is_extracted_once(self, gemini, tmp_path):
+        """Test a repeated image is served from the cache as a fresh copy."""
+        image = tmp_path / "card.jpg"
+        image.write_bytes(b"card image")
+        copy = tmp_path / "copy.jpg"
+        copy.write_bytes(b"card image")
+
+        first = gemini.extract(image)
+        first.phone.append("changed")
+        second = gemini.extract(copy)
+
+        assert gemini.calls == 1
+        assert second.phone == ["5551234567"]
+
+    def test_expired_result_is_extracted_again(self, gemini, tmp_path, monkeypatch):
+        """Test a result older than cache_ttl is not reused."""
+        now = [0.0]
+        monkeypatch.setattr(vlm_ocr.time, "monotonic", lambda: now[0])
+        image = tmp_path / "card.jpg"
+        image.write_bytes(b"card image")
+
+        gemini.extract(image)
+        now[0] += gemini.cache_ttl + 1
+        gemini.extract(image)
+
+        assert gemini.calls == 2
+
+    def test_concurrent_requests_share_one_call(self, gemini, tmp_path, monkeypatch):
+        """Test threads asking for the same uncached image wait for one request."""
+        import threading
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_extract(image_path, image_bytes=None):
+            gemini.calls += 1
+            started.set()
+            release.wait(5)
+            return vlm_ocr.VLMResult(success=True, name="John Doe")
+
+        monkeypatch.setattr(gemini, "_extract_uncached", slow_extract)
+        image = tmp_path / "card.jpg"
+        image.write_bytes(b"card image")
+        other = tmp_path / "other.jpg"
+        other.write_bytes(b"other card")
+        gemini._cache_put(
+            hashlib.blake2b(b"other card" + gemini.model_name.encode("utf-8"), digest_size=16).digest(),
+            vlm_ocr.VLMResult(success=True, name="Jane Roe")
+        )
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(gemini.extract(image)))
+                   for _ in range(3)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+
+        # A cached image is served while the other request is in flight
+        assert gemini.extract(other).name == "Jane Roe"
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert gemini.calls == 1
+        assert [r.name for r in results] == ["John Doe"] * 3
+
+
+class TestGeminiCircuitBreaker:
+    """Test cases for pausing Gemini after repeated failures."""
+
+    def test_repeated_failures_pause_requests(self, monkeypatch, tmp_path):
+        """Test requests stop after BREAKER_FAILURES errors and resume after the pause."""
+        now = [0.0]
+        monkeypatch.setattr(vlm_ocr.time, "monotonic", lambda: now[0])
+        gemini = GeminiOCR(api_key=None, max_retries=0)
+        calls = []
+
+        def fake_generate(image_path, image_data):
+            calls.append(image_path)
+            raise ValueError("service unavailable")
+
+        monkeypatch.setattr(gemini, "_generate", fake_generate)
+        image = tmp_path / "card.jpg"
+        image.write_bytes(b"card image")
+
+        for _ in range(GeminiOCR.BREAKER_FAILURES + 2):
+            assert not gemini._extract_uncached(image).success
+        assert len(calls) == GeminiOCR.BREAKER_FAILURES
+
+        now[0] += GeminiOCR.BREAKER_RESET + 1
+        gemini._extract_uncached(image)
+        gemini._extract_uncached(image)
+        assert len(calls) == GeminiOCR.BREAKER_FAILURES + 1
+
+    def test_only_one_trial_request_after_pause(self, monkeypatch, tmp_path):
+        """Test callers stay paused while the post-pause trial request runs."""
+        import threading
+        now = [0.0]
+        monkeypatch.setattr(vlm_ocr.time, "monotonic", lambda: now[0])
+        gemini = GeminiOCR(api_key=None, max_retries=0)
+        in_trial = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fake_generate(image_path, image_data):
+            calls.append(image_path)
+            if len(calls) > GeminiOCR.BREAKER_FAILURES:
+                in_trial.set()
+                release.wait(5)
+            raise ValueError("service unavailable")
+
+        monkeypatch.setattr(gemini, "_generate", fake_generate)
+        image = tmp_path / "card.jpg"
+        image.write_bytes(b"card image")
+
+        for _ in range(GeminiOCR.BREAKER_FAILURES):
+            gemini._extract_uncached(image)
+        now[0] += GeminiOCR.BREAKER_RESET + 1
+
+        trial = threading.Thread(target=gemini._extract_uncached, args=(image,))
+        trial.start()
+        in_trial.wait(5)
+        assert not gemini._extract_uncached(image).success
+        assert len(calls) == GeminiOCR.BREAKER_FAILURES + 1
+
+        release.set()
+        trial.join(5)
+        # The failed trial starts a new pause
+        gemini._extract_uncached(image)
+        assert len(calls) == GeminiOCR.BREAKER_FAILURES + 1
+